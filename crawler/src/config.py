@@ -8,6 +8,7 @@ from pathlib import Path
 import yaml
 
 from .logger import get_logger
+from .utils.yaml import safe_load
 
 logger = get_logger(__name__)
 
@@ -114,7 +115,7 @@ def load_sources_config(config_path: Path) -> SourcesConfig:
 
     try:
         with open(config_path, encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f)
+            raw_config = safe_load(f)
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Invalid YAML in sources config: {e}") from e
 
@@ -30,6 +30,11 @@ class BaseCrawler(ABC):
     # Override in subclass with source identifier
     source_name: str = "unknown"
 
+    # Set to False in subclasses that fetch their events from an API or
+    # AJAX endpoint: crawl() then skips fetching and parsing the base URL
+    # and calls parse_events(None)
+    fetches_listing_page: bool = True
+
     def __init__(
         self,
         config: dict,
@@ -61,6 +66,12 @@ class BaseCrawler(ABC):
         self.source_id = config.get("id", "unknown")
         self.base_url = config.get("url", "")
         self.category_map = config.get("category_map", {})
+        # Lowercased (key, category) pairs for map_category, in config order
+        # so the first matching key still wins
+        self._category_lookup = tuple(
+            (source_cat.lower(), target_cat)
+            for source_cat, target_cat in self.category_map.items()
+        )
 
         # Selection criteria (optional)
         self.selection_criteria: SelectionCriteria | None = config.get(
@@ -83,14 +94,17 @@ class BaseCrawler(ABC):
         # Reset selection stats
         self.selection_stats = {"accepted": 0, "rejected": 0}
 
-        # Fetch the page
-        html = self.fetch_page(self.base_url)
-        if not html:
-            logger.error(f"Failed to fetch page: {self.base_url}")
-            return []
+        parser = None
+        if self.fetches_listing_page:
+            # Fetch the page
+            html = self.fetch_page(self.base_url)
+            if not html:
+                logger.error(f"Failed to fetch page: {self.base_url}")
+                return []
+
+            parser = HTMLParser(html, self.base_url)
 
-        # Parse events from HTML
-        parser = HTMLParser(html, self.base_url)
+        # Parse events from HTML (or from the source's API when parser is None)
         events = self.parse_events(parser)
 
         logger.info(f"Parsed {len(events)} events from {self.source_name}")
@@ -156,7 +170,7 @@ class BaseCrawler(ABC):
         return results
 
     @abstractmethod
-    def parse_events(self, parser: HTMLParser) -> list[Event]:
+    def parse_events(self, parser: HTMLParser | None) -> list[Event]:
         """
         Parse events from HTML content.
 
@@ -164,7 +178,8 @@ class BaseCrawler(ABC):
         extraction logic.
 
         Args:
-            parser: HTMLParser instance with page content
+            parser: HTMLParser instance with page content, or None when
+                fetches_listing_page is False
 
         Returns:
             List of Event objects
@@ -244,10 +259,12 @@ class BaseCrawler(ABC):
         if self.selection_criteria:
             return self.selection_criteria.map_category(raw_category)
 
-        # Look up in source-specific category map
-        if self.category_map:
-            for source_cat, target_cat in self.category_map.items():
-                if source_cat.lower() in raw_category.lower():
+        # Look up in source-specific category map: first key (in config
+        # order) contained in the raw category wins
+        if self._category_lookup:
+            raw_key = raw_category.lower()
+            for source_cat, target_cat in self._category_lookup:
+                if source_cat in raw_key:
                     return target_cat
 
         # Default mappings
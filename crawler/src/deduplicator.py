@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 import frontmatter
 
+from .generators.markdown import read_front_matter_fields
 from .logger import get_logger
 
 if TYPE_CHECKING:
@@ -16,8 +17,22 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
-
-@dataclass
+# Front matter fields read when indexing existing events
+_INDEX_FIELDS = (
+    "name",
+    "eventName",
+    "title",
+    "date",
+    "locations",
+    "startTime",
+    "eventURL",
+    "sourceId",
+    "description",
+    "image",
+)
+
+
+@dataclass(slots=True)
 class DuplicateResult:
     """Result of duplicate detection check."""
 
@@ -33,9 +48,14 @@ class DuplicateResult:
         return 0.5 <= self.confidence < 0.7
 
 
-@dataclass
+@dataclass(slots=True)
 class EventIndex:
-    """Indexed event data for fast lookup."""
+    """
+    Indexed event data for fast lookup.
+
+    Slotted like Event: the index holds one instance per existing event
+    file, and the matching loops read their fields for every new event.
+    """
 
     path: Path
     name: str
@@ -48,7 +68,7 @@ class EventIndex:
     image: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeResult:
     """Result of merging duplicate event data."""
 
@@ -117,7 +137,7 @@ class EventDeduplicator:
 
     def _load_event_file(self, md_file: Path) -> EventIndex | None:
         """Load event data from markdown file."""
-        post = frontmatter.load(md_file)
+        post = read_front_matter_fields(md_file, _INDEX_FIELDS)
 
         # Get event name (try multiple field names for compatibility)
         name = post.get("name") or post.get("eventName") or post.get("title", "")
@@ -1,5 +1,10 @@
 """Hugo markdown file generator."""
 
+import os
+import re
+import threading
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +14,7 @@ import yaml
 
 from ..logger import get_logger
 from ..utils.sanitize import sanitize_description
+from ..utils.yaml import safe_load
 
 if TYPE_CHECKING:
     from ..deduplicator import EventDeduplicator
@@ -16,6 +22,146 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Options shared by every YAML dump of front matter. The dumps stay on the
+# pure-Python emitter: libyaml's escapes emoji even with allow_unicode, which
+# would rewrite descriptions in existing content files.
+_YAML_DUMP_OPTIONS = {
+    "default_flow_style": False,
+    "allow_unicode": True,
+    "sort_keys": False,
+    "width": 1000,  # Prevent line wrapping
+}
+
+# Strings PyYAML would quote or style: a leading indicator or space, ": " or
+# " #" inside, a trailing colon or space, a document marker, or any character
+# outside the printable ranges it writes as-is with allow_unicode
+_NEEDS_YAML_STYLE_RE = re.compile(
+    r"^[\s\-?:,\[\]{}#&*!|>'\"%@`]|^\.\.\.|: | #|[:\s]$"
+    r"|[^\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd]"
+)
+
+# Longest plain value written directly; longer ones may be folded by PyYAML
+_MAX_PLAIN_LENGTH = 900
+
+_yaml_resolver = yaml.resolver.Resolver()
+
+# A front matter delimiter line, as python-frontmatter recognizes it
+_FRONT_MATTER_BOUNDARY_RE = re.compile(r"-{3,}\s*")
+
+
+def _inline_scalar(value: object) -> str | None:
+    """
+    Return ``value`` as PyYAML would write it on one line, or None.
+
+    Strings come back bare, or single-quoted when bare text would load as
+    another type (dates, times, numbers). None means PyYAML might escape,
+    double-quote, or fold the value, so the caller must let PyYAML render it.
+    """
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return str(value)
+    if type(value) is not str:
+        return None
+    if (
+        not value
+        or len(value) > _MAX_PLAIN_LENGTH
+        or _NEEDS_YAML_STYLE_RE.search(value)
+    ):
+        return None
+    # Text that would load back as a bool, number, date or null is quoted
+    tag = _yaml_resolver.resolve(yaml.ScalarNode, value, (True, False))
+    if tag != "tag:yaml.org,2002:str":
+        return "'" + value.replace("'", "''") + "'"
+    return value
+
+
+def read_front_matter_fields(path: Path, keys: Collection[str]) -> dict:
+    """
+    Read selected top-level fields from a content file's front matter.
+
+    Reads the file only up to the closing delimiter and parses only the
+    lines of the requested keys, so the body and the other fields are
+    never loaded. Values come back as a full YAML load would give them.
+
+    Args:
+        path: Markdown file with YAML front matter
+        keys: Top-level keys to read
+
+    Returns:
+        Dictionary of the requested keys present in the front matter
+    """
+    selected: list[str] = []
+    keep = False
+    with open(path, encoding="utf-8") as fh:
+        if not _FRONT_MATTER_BOUNDARY_RE.fullmatch(fh.readline()):
+            return {}
+        for line in fh:
+            if _FRONT_MATTER_BOUNDARY_RE.fullmatch(line):
+                break
+            # A top-level key starts its line; anything else continues
+            # the entry above (block lists, folded text, blank lines)
+            if line[:1] not in ("", " ", "\t", "\r", "\n", "-", "#"):
+                keep = line.partition(":")[0] in keys
+            if keep:
+                selected.append(line)
+        else:
+            return {}
+    data = safe_load("".join(selected)) if selected else None
+    return data if isinstance(data, dict) else {}
+
+
+def _emit_entry(key: object, value: object) -> str:
+    """Serialize one top-level front matter entry the way yaml.dump does."""
+    if type(key) is str and _inline_scalar(key) == key:
+        if type(value) is list:
+            items = [_inline_scalar(item) for item in value]
+            if None not in items:
+                if not items:
+                    return f"{key}: []\n"
+                return f"{key}:\n" + "".join(f"- {item}\n" for item in items)
+        else:
+            plain = _inline_scalar(value)
+            if plain is not None:
+                return f"{key}: {plain}\n"
+    return yaml.dump({key: value}, **_YAML_DUMP_OPTIONS)
+
+
+def _emit_front_matter(
+    front_matter: dict, rendered: dict[object, tuple[object, str]] | None = None
+) -> str:
+    """
+    Serialize front matter to YAML the way yaml.dump does.
+
+    Scalars and lists of scalars are written directly; any entry holding a
+    value that needs quoting, escaping, or line folding (typically a long
+    or multi-line description) is rendered by PyYAML on its own. Top-level
+    block mapping entries are independent, so the result is identical to
+    dumping the whole dict.
+
+    ``rendered`` carries entries between calls for similar front matter:
+    an entry whose value equals the one last recorded for its key reuses
+    the recorded text.
+    """
+    if rendered is None:
+        return "".join(_emit_entry(key, value) for key, value in front_matter.items())
+    parts: list[str] = []
+    for key, value in front_matter.items():
+        previous = rendered.get(key)
+        if (
+            previous is not None
+            and type(previous[0]) is type(value)
+            and previous[0] == value
+        ):
+            parts.append(previous[1])
+            continue
+        text = _emit_entry(key, value)
+        rendered[key] = (value, text)
+        parts.append(text)
+    return "".join(parts)
+
 
 @dataclass
 class GeneratorStats:
@@ -79,7 +225,7 @@ class MarkdownGenerator:
     Features:
     - Duplicate detection integration
     - Statistics tracking
-    - Batch processing
+    - Batch processing, optionally threaded
     - Multi-day event support
     - Dry-run mode
     """
@@ -90,6 +236,7 @@ class MarkdownGenerator:
         dry_run: bool = False,
         deduplicator: "EventDeduplicator | None" = None,
         skip_existing: bool = True,
+        parallel: int = 1,
     ):
         """
         Initialize the markdown generator.
@@ -99,12 +246,23 @@ class MarkdownGenerator:
             dry_run: If True, only log actions without writing files
             deduplicator: Optional deduplicator for duplicate checking
             skip_existing: If True, skip events that already have files
+            parallel: Number of threads generate_batch writes files with
         """
         self.output_dir = Path(output_dir)
         self.dry_run = dry_run
         self.deduplicator = deduplicator
         self.skip_existing = skip_existing
+        self.parallel = max(1, parallel)
         self.stats = GeneratorStats()
+        self._lock = threading.Lock()
+        self._created_dirs: set[Path] = set()
+        # Files written since the last reset_stats(), known to exist
+        self._written_paths: set[Path] = set()
+        # source ID -> files, and the reverse; built on first lookup
+        self._source_index: dict[str, list[Path]] | None = None
+        self._indexed_sources: dict[Path, str] = {}
+        # Shared across the days of a generate_multi_day call, else None
+        self._rendered: dict[object, tuple[object, str]] | None = None
 
     def generate(
         self,
@@ -122,7 +280,7 @@ class MarkdownGenerator:
             GenerateResult with status and file path
         """
         file_path = self.output_dir / event.file_path
-        logger.debug(f"Processing event: {event.name}")
+        logger.debug("Processing event: %s", event.name)
 
         # Check for duplicates if deduplicator is available
         if check_duplicate and self.deduplicator:
@@ -134,7 +292,7 @@ class MarkdownGenerator:
                         dup_result.existing_file, event
                     )
                     if merge_result.updated:
-                        self.stats.updated += 1
+                        self._count("updated")
                         logger.info(
                             f"Merged duplicate: {event.name} -> {dup_result.existing_file}"
                         )
@@ -145,7 +303,7 @@ class MarkdownGenerator:
                             reason=f"Merged: {', '.join(dup_result.match_reasons)}",
                         )
                 # Skip duplicate
-                self.stats.skipped_duplicate += 1
+                self._count("skipped_duplicate")
                 logger.info(f"Skipped duplicate: {event.name}")
                 return GenerateResult(
                     success=True,
@@ -155,9 +313,11 @@ class MarkdownGenerator:
                 )
 
         # Check if file already exists
-        if self.skip_existing and file_path.exists():
-            self.stats.skipped_exists += 1
-            logger.debug(f"File already exists: {file_path}")
+        if self.skip_existing and (
+            file_path in self._written_paths or file_path.exists()
+        ):
+            self._count("skipped_exists")
+            logger.debug("File already exists: %s", file_path)
             return GenerateResult(
                 success=True,
                 file_path=file_path,
@@ -179,8 +339,8 @@ class MarkdownGenerator:
 
         if self.dry_run:
             logger.info(f"[DRY RUN] Would create: {file_path}")
-            logger.debug(f"Content:\n{content}")
-            self.stats.created += 1
+            logger.debug("Content:\n%s", content)
+            self._count("created")
             return GenerateResult(
                 success=True,
                 file_path=file_path,
@@ -190,7 +350,11 @@ class MarkdownGenerator:
 
         try:
             self._write_file(file_path, content)
-            self.stats.created += 1
+            self._written_paths.add(file_path)
+            if event.source_id and self._source_index is not None:
+                with self._lock:
+                    self._index_source(event.source_id, file_path)
+            self._count("created")
             logger.info(f"Created: {file_path}")
             return GenerateResult(
                 success=True,
@@ -198,7 +362,7 @@ class MarkdownGenerator:
                 action="created",
             )
         except Exception as e:
-            self.stats.failed += 1
+            self._count("failed")
             logger.error(f"Failed to create {file_path}: {e}")
             return GenerateResult(
                 success=False,
@@ -215,6 +379,10 @@ class MarkdownGenerator:
         """
         Generate markdown files for multiple events.
 
+        With ``parallel`` above 1 and no duplicate checking, files are
+        written from a thread pool. Events sharing a file path stay on
+        one thread, in order, and results keep the order of ``events``.
+
         Args:
             events: List of Event instances
             check_duplicate: Whether to check for duplicates
@@ -222,14 +390,45 @@ class MarkdownGenerator:
         Returns:
             List of GenerateResult for each event
         """
-        results = []
-        for event in events:
-            result = self.generate(event, check_duplicate=check_duplicate)
-            results.append(result)
-
+        results = self._generate_all(events, check_duplicate)
         self._log_summary()
         return results
 
+    def _generate_all(
+        self, events: list["Event"], check_duplicate: bool
+    ) -> list[GenerateResult]:
+        """Generate events in order, or from a thread pool when allowed."""
+        # The deduplicator reads and merges files event by event, so it
+        # has to see each event's outcome before checking the next one
+        if self.parallel == 1 or (check_duplicate and self.deduplicator):
+            return [
+                self.generate(event, check_duplicate=check_duplicate)
+                for event in events
+            ]
+
+        by_path: dict[Path, list[int]] = {}
+        for index, event in enumerate(events):
+            by_path.setdefault(self.output_dir / event.file_path, []).append(index)
+
+        if not self.dry_run:
+            for parent in {path.parent for path in by_path} - self._created_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(parent)
+
+        results: list[GenerateResult | None] = [None] * len(events)
+
+        def generate_path(indexes: list[int]) -> None:
+            for index in indexes:
+                results[index] = self.generate(
+                    events[index], check_duplicate=check_duplicate
+                )
+
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            # list() re-raises anything a worker raised
+            list(executor.map(generate_path, by_path.values()))
+
+        return results
+
     def generate_multi_day(
         self,
         base_event: "Event",
@@ -240,6 +439,8 @@ class MarkdownGenerator:
         Generate linked markdown files for a multi-day event.
 
         Creates separate files for each day with eventGroupId linking them.
+        Days are written in parallel under the same conditions as
+        generate_batch.
 
         Args:
             base_event: Base event with common information
@@ -259,17 +460,14 @@ class MarkdownGenerator:
             group_id = f"{slugify(base_event.name)}-{dates[0].strftime('%Y%m')}"
 
         total_days = len(dates)
-        results = []
-
-        for i, event_date in enumerate(sorted(dates), start=1):
-            # Create event for this day
-            day_event = Event(
+        start_time = base_event.start_datetime.time()
+        tzinfo = base_event.start_datetime.tzinfo
+        day_events = [
+            Event(
                 name=base_event.name,
                 event_url=base_event.event_url,
                 start_datetime=datetime.combine(
-                    event_date.date(),
-                    base_event.start_datetime.time(),
-                    tzinfo=base_event.start_datetime.tzinfo,
+                    event_date.date(), start_time, tzinfo=tzinfo
                 ),
                 description=base_event.description,
                 image=base_event.image,
@@ -283,9 +481,16 @@ class MarkdownGenerator:
                 else None,
                 draft=base_event.draft,
             )
+            for i, event_date in enumerate(sorted(dates), start=1)
+        ]
 
-            result = self.generate(day_event, check_duplicate=True)
-            results.append(result)
+        # The days share most front matter entries: serialize those once
+        # for the whole event (sanitize_description caches the text)
+        self._rendered = {}
+        try:
+            results = self._generate_all(day_events, check_duplicate=True)
+        finally:
+            self._rendered = None
 
         logger.info(
             f"Generated {len(results)} files for multi-day event: {base_event.name}"
@@ -303,14 +508,7 @@ class MarkdownGenerator:
         Returns:
             Complete markdown file content
         """
-        # Use block style for lists, default flow style for simple values
-        yaml_content = yaml.dump(
-            front_matter,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-            width=1000,  # Prevent line wrapping
-        )
+        yaml_content = _emit_front_matter(front_matter, self._rendered)
 
         # Build final content
         content = f"---\n{yaml_content}---\n"
@@ -321,20 +519,36 @@ class MarkdownGenerator:
 
         return content
 
+    def _count(self, field: str) -> None:
+        """Increment a statistics counter; safe across batch threads."""
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
+
     def _write_file(self, file_path: Path, content: str):
         """
         Write content to file, creating directories as needed.
 
+        The content is written in one call to a temporary sibling file that
+        then replaces the target, so readers never see a partial file.
+
         Args:
             file_path: Path to write to
             content: Content to write
         """
-        # Create parent directories
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create parent directories, once per directory for this generator
+        parent = file_path.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
 
         # Write file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(content.encode("utf-8"))
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def _log_summary(self):
         """Log a summary of generation statistics."""
@@ -351,6 +565,9 @@ class MarkdownGenerator:
         """
         Check if an event file already exists.
 
+        Files this generator wrote since the last reset_stats() are
+        answered from memory, as in generate's skip-existing check.
+
         Args:
             event: Event to check
 
@@ -358,13 +575,15 @@ class MarkdownGenerator:
             True if file exists
         """
         file_path = self.output_dir / event.file_path
-        return file_path.exists()
+        return file_path in self._written_paths or file_path.exists()
 
     def find_by_source_id(self, source_id: str) -> list[Path]:
         """
         Find existing files with a given source ID.
 
-        This can be used for duplicate detection.
+        This can be used for duplicate detection. Lookups go through an
+        in-memory index built by one scan of the output directory on first
+        use and kept current as this generator writes files.
 
         Args:
             source_id: Source ID to search for
@@ -372,15 +591,33 @@ class MarkdownGenerator:
         Returns:
             List of matching file paths
         """
-        matches = []
+        if self._source_index is None:
+            self.refresh_index()
+        paths = self._source_index.get(source_id, [])
+        return [path for path in paths if path.exists()]
+
+    def refresh_index(self) -> None:
+        """Rebuild the source ID index from the output directory."""
+        self._source_index = {}
+        self._indexed_sources = {}
         for file_path in self.output_dir.rglob("*.fr.md"):
             try:
-                content = file_path.read_text(encoding="utf-8")
-                if f"sourceId: {source_id}" in content:
-                    matches.append(file_path)
+                fields = read_front_matter_fields(file_path, ("sourceId",))
             except Exception:
                 continue
-        return matches
+            source_id = fields.get("sourceId")
+            if source_id:
+                self._index_source(str(source_id), file_path)
+
+    def _index_source(self, source_id: str, file_path: Path) -> None:
+        """Record that ``file_path`` holds the event with ``source_id``."""
+        previous = self._indexed_sources.get(file_path)
+        if previous == source_id:
+            return
+        if previous is not None:
+            self._source_index[previous].remove(file_path)
+        self._indexed_sources[file_path] = source_id
+        self._source_index.setdefault(source_id, []).append(file_path)
 
     def get_stats(self) -> dict[str, int]:
         """
@@ -394,3 +631,4 @@ class MarkdownGenerator:
     def reset_stats(self):
         """Reset generation statistics."""
         self.stats.reset()
+        self._written_paths.clear()
@@ -4,6 +4,9 @@ Logging configuration for the crawler.
 This module provides a comprehensive logging system with configurable levels,
 colored console output, rotating file handler, and optional JSON formatting.
 
+File output goes through a queue: callers only enqueue records, and a
+background listener thread does the disk writes.
+
 Usage:
     from src.logger import setup_logging, get_logger
 
@@ -13,15 +16,36 @@ Usage:
     # Get a logger in any module
     logger = get_logger(__name__)
     logger.info("Processing event: %s", event_name)
+
+Pass values as arguments rather than pre-building the message: a call
+below the configured level then returns before any string is built. For
+values that are costly to compute, guard the call explicitly:
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Payload: %s", expensive_dump(data))
 """
 
+import atexit
+import copy
 import json
 import logging
+import os
+import queue
 import sys
+import time
 from datetime import UTC, datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON logs fall back to the stdlib
+    orjson = None
 
 # Default log format strings
 CONSOLE_FORMAT = "%(asctime)s %(levelname)-8s [%(name)s] %(message)s"
@@ -32,6 +56,8 @@ JSON_FORMAT = None  # Handled by JSONFormatter
 DEFAULT_MAX_BYTES = 10 * 1024 * 1024  # 10MB
 DEFAULT_BACKUP_COUNT = 5
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_FLUSH_INTERVAL = 1.0  # seconds a buffered record may wait
+FILE_BUFFER_SIZE = 64 * 1024  # write buffer of the log file
 
 # Color codes for terminal output
 COLORS = {
@@ -44,7 +70,248 @@ COLORS = {
 }
 
 
-class ColorFormatter(logging.Formatter):
+# Background listener writing queued records to the file handler
+_queue_listener: QueueListener | None = None
+
+# Process-wide LogRecord settings that setup_logging changes
+_RECORD_FLAGS = ("logThreads", "logProcesses", "logMultiprocessing", "logAsyncioTasks")
+_MISSING = object()
+
+# The record factory and flags in place before setup_logging first ran
+_saved_record_settings: tuple[Any, dict[str, Any]] | None = None
+
+
+class CachingLogRecord(logging.LogRecord):
+    """
+    LogRecord that merges its message arguments only once.
+
+    The console formatter and the file queue handler both call
+    getMessage() on the same record; the second call reuses the first
+    result as long as msg and args are unchanged.
+    """
+
+    _message_cache: tuple[Any, Any, str] | None = None
+
+    def getMessage(self) -> str:
+        """Return the merged message, computing it on first use."""
+        cache = self._message_cache
+        if cache is not None and cache[0] is self.msg and cache[1] is self.args:
+            return cache[2]
+        message = super().getMessage()
+        self._message_cache = (self.msg, self.args, message)
+        return message
+
+
+class LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for an in-process queue.
+
+    The stdlib prepare() renders the whole record, traceback included, into
+    the message so it can be pickled. Here the queue never leaves the
+    process, so only the message arguments are merged on the caller's
+    thread; exc_info and extra fields reach the file formatter intact.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copy the record with its message arguments already merged."""
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+class BufferingQueueListener(QueueListener):
+    """
+    QueueListener that also flushes its handlers on a timer.
+
+    The log file is written through a large buffer, so records reach the
+    disk in bursts. While waiting on the queue the listener flushes at least
+    every ``flush_interval`` seconds, so a quiet crawler never leaves
+    records sitting in the buffer.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.SimpleQueue,
+        *handlers: logging.Handler,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        respect_handler_level: bool = False,
+    ):
+        super().__init__(
+            log_queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.flush_interval = flush_interval
+        self._flush_deadline = time.monotonic() + flush_interval
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Return the next record, flushing handlers whenever the deadline passes."""
+        while True:
+            wait = self._flush_deadline - time.monotonic()
+            if wait > 0:
+                try:
+                    return self.queue.get(block, wait)
+                except queue.Empty:
+                    if not block:
+                        raise
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    # An escaping error would end the listener thread and
+                    # leave records piling up in the queue; report it the
+                    # way a failed emit() is reported instead
+                    handler.handleError(
+                        logging.makeLogRecord(
+                            {"msg": "Periodic flush of %r failed", "args": (handler,)}
+                        )
+                    )
+            self._flush_deadline = time.monotonic() + self.flush_interval
+
+
+class CountingRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that keeps its own count of the file size.
+
+    The stdlib handler stats the file, seeks, and formats each record twice
+    (once to measure it) on every emit. This one formats once and compares
+    a running character count against maxBytes, the same approximation the
+    stdlib makes for the pending message.
+
+    With ``buffer_size`` set, the file is opened with that write buffer and
+    records below ``flush_level`` are no longer flushed one by one: they
+    are formatted straight into the buffer, which the io layer writes out
+    whenever it fills. Whoever feeds the handler must call flush() to
+    push out the rest (see BufferingQueueListener).
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        buffer_size: int | None = None,
+        flush_level: int = logging.ERROR,
+        **kwargs: Any,
+    ) -> None:
+        # Set before super().__init__, which opens the file
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        if self.buffer_size is None:
+            stream = super()._open()
+        else:
+            stream = open(
+                self.baseFilename,
+                self.mode,
+                buffering=self.buffer_size,
+                encoding=self.encoding,
+                errors=self.errors,
+            )
+        # Only regular files are rotated (bpo-45401); append mode opens at EOF
+        self._rotatable = os.path.isfile(self.baseFilename)
+        self._size = stream.tell()
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, rolling the file over first if it would overflow."""
+        try:
+            text = self.format(record) + self.terminator
+            if self.stream is None:  # delay was set
+                self.stream = self._open()
+            if (
+                self.maxBytes > 0
+                and self._rotatable
+                and self._size
+                and self._size + len(text) >= self.maxBytes
+            ):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(text)
+            if self.buffer_size is None or record.levelno >= self.flush_level:
+                self.flush()
+            self._size += len(text)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _stop_queue_listener() -> None:
+    """Drain the log queue, then close the handlers it was feeding."""
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    listener, _queue_listener = _queue_listener, None
+    listener.stop()  # processes every queued record before returning
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _apply_record_settings() -> None:
+    """Install the caching record factory and skip unused record details."""
+    global _saved_record_settings
+    if _saved_record_settings is None:
+        _saved_record_settings = (
+            logging.getLogRecordFactory(),
+            {flag: getattr(logging, flag, _MISSING) for flag in _RECORD_FLAGS},
+        )
+
+    # Format each message once across handlers, unless a custom factory is set
+    if logging.getLogRecordFactory() is logging.LogRecord:
+        logging.setLogRecordFactory(CachingLogRecord)
+
+    # None of our formats show thread, process or task, so skip collecting them
+    for flag in _RECORD_FLAGS:
+        setattr(logging, flag, False)  # logAsyncioTasks is new in 3.12
+
+
+def _restore_record_settings() -> None:
+    """Put back the record factory and flags saved by _apply_record_settings."""
+    global _saved_record_settings
+    if _saved_record_settings is None:
+        return
+    factory, flags = _saved_record_settings
+    _saved_record_settings = None
+    # A factory installed by someone else since then is theirs to keep
+    if logging.getLogRecordFactory() is CachingLogRecord:
+        logging.setLogRecordFactory(factory)
+    for flag, value in flags.items():
+        if value is _MISSING:
+            if hasattr(logging, flag):
+                delattr(logging, flag)
+        else:
+            setattr(logging, flag, value)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the creation time once per wall-clock second.
+
+    formatTime() converts the timestamp with time.localtime() and strftime
+    for every record; records logged within the same second share the
+    result. Times stay in local time, as with the stock formatter.
+    """
+
+    # (second, datefmt, rendered time) of the last record formatted
+    _time_cache: tuple[int, str | None, str] = (-1, None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Return the record's creation time, reusing the last second's text."""
+        second = int(record.created)
+        cached_second, cached_datefmt, rendered = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            rendered = time.strftime(
+                datefmt or self.default_time_format, self.converter(second)
+            )
+            self._time_cache = (second, datefmt, rendered)
+        if not datefmt and self.default_msec_format:
+            return self.default_msec_format % (rendered, record.msecs)
+        return rendered
+
+
+class ColorFormatter(CachedTimeFormatter):
     """
     Custom formatter that adds ANSI colors to log level names for console output.
 
@@ -52,22 +319,109 @@ class ColorFormatter(logging.Formatter):
     color codes, making the console output both readable and visually organized.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once instead of per record
+        reset = COLORS["RESET"]
+        self._colored_levelnames = {
+            name: f"{color}{name}{reset}"
+            for name, color in COLORS.items()
+            if name != "RESET"
+        }
+        # The default console layout is filled by an f-string, not %-style
+        self._console_layout = self._fmt == CONSOLE_FORMAT and isinstance(
+            self._style, logging.PercentStyle
+        )
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Fill the format string, with a fast path for CONSOLE_FORMAT."""
+        if self._console_layout:
+            return (
+                f"{record.asctime} {record.levelname:<8} "
+                f"[{record.name}] {record.message}"
+            )
+        return super().formatMessage(record)
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record with colored level name."""
         # Store original level name
         original_levelname = record.levelname
 
         # Apply color to level name
-        level_color = COLORS.get(record.levelname, "")
-        reset = COLORS["RESET"]
-        record.levelname = f"{level_color}{record.levelname}{reset}"
-
-        # Format the message
-        result = super().format(record)
+        colored = self._colored_levelnames.get(original_levelname)
+        if colored is None:
+            colored = f"{original_levelname}{COLORS['RESET']}"
+        record.levelname = colored
+
+        # Format the message, restoring the level name even if it fails
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original_levelname
+
+
+# Escapes and quotes a str exactly as json.dumps(ensure_ascii=False) would
+_encode_json_str = json.encoder.encode_basestring
+
+# LogRecord attributes that are not "extra" fields: the ones LogRecord sets
+# itself, plus those formatters add while rendering (asctime, message,
+# exc_text) and CachingLogRecord's message cache
+_RECORD_ATTRIBUTES = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "exc_info",
+        "exc_text",
+        "thread",
+        "threadName",
+        "taskName",
+        "message",
+        "asctime",
+        "_message_cache",
+    }
+)
+
+
+def _json_default(obj: Any) -> str:
+    """Serialize values the stdlib encoder cannot, matching orjson's output."""
+    if isinstance(obj, datetime):
+        return obj.isoformat().replace("+00:00", "Z")
+    return str(obj)
+
+
+def _dumps_json(data: dict[str, Any]) -> str:
+    """
+    Encode a log entry with orjson when available, else the json module.
 
-        # Restore original level name
-        record.levelname = original_levelname
-        return result
+    Both produce orjson's layout: compact separators and non-ASCII text
+    left as is, which the fixed-schema template in JSONFormatter matches.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles those
+    return json.dumps(
+        data, default=_json_default, separators=(",", ":"), ensure_ascii=False
+    )
 
 
 class JSONFormatter(logging.Formatter):
@@ -78,53 +432,65 @@ class JSONFormatter(logging.Formatter):
     and automated log analysis tools.
     """
 
+    # (millisecond, ISO string) of the last timestamp rendered
+    _timestamp_cache: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """Render the record's creation time, reusing it within a millisecond."""
+        millis = int(record.created * 1000)
+        cached_millis, cached = self._timestamp_cache
+        if millis == cached_millis:
+            return cached
+        iso = datetime.fromtimestamp(millis / 1000, tz=UTC).isoformat(
+            timespec="milliseconds"
+        )
+        timestamp = iso.replace("+00:00", "Z")
+        self._timestamp_cache = (millis, timestamp)
+        return timestamp
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as a JSON object."""
-        log_data: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-        }
-
-        # Add exception info if present
+        timestamp = self._timestamp(record)
+        message = record.getMessage()
+        exception = None
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            # Reuse the traceback text another formatter already rendered
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            exception = record.exc_text
 
         # Add extra fields from record
         extra_fields = {
-            k: v
-            for k, v in record.__dict__.items()
-            if k
-            not in {
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "stack_info",
-                "exc_info",
-                "exc_text",
-                "thread",
-                "threadName",
-                "taskName",
-                "message",
-            }
+            k: v for k, v in record.__dict__.items() if k not in _RECORD_ATTRIBUTES
         }
         if extra_fields:
+            log_data: dict[str, Any] = {
+                "timestamp": timestamp,
+                "level": record.levelname,
+                "logger": record.name,
+                "message": message,
+            }
+            if exception is not None:
+                log_data["exception"] = exception
             log_data["extra"] = extra_fields
+            return _dumps_json(log_data)
+
+        # Fixed schema: fill a template instead of running a JSON encoder
+        encode = _encode_json_str
+        entry = (
+            f'{{"timestamp":"{timestamp}","level":{encode(record.levelname)},'
+            f'"logger":{encode(record.name)},"message":{encode(message)}'
+        )
+        if exception is not None:
+            entry += f',"exception":{encode(exception)}'
+        return entry + "}"
+
 
-        return json.dumps(log_data, default=str)
+def _file_formatter(log_format: str) -> logging.Formatter:
+    """Return the formatter for file output based on the format option."""
+    if log_format.lower() == "json":
+        return JSONFormatter()
+    return CachedTimeFormatter(FILE_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
 
 
 def setup_logging(
@@ -134,15 +500,22 @@ def setup_logging(
     log_format: str = "text",
     max_bytes: int = DEFAULT_MAX_BYTES,
     backup_count: int = DEFAULT_BACKUP_COUNT,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    stream: TextIO | None = None,
 ) -> logging.Logger:
     """
     Configure logging for the crawler application.
 
     This function sets up a comprehensive logging system with:
     - Colored console output for human readability
-    - Optional rotating file handler to prevent unbounded log growth
+    - Optional rotating file handler to prevent unbounded log growth,
+      written in buffered bursts from a background thread behind a queue
     - Support for both text and JSON output formats
 
+    It also installs a caching LogRecord factory and stops records from
+    collecting thread and process details. Both settings are process-wide;
+    teardown_logging() restores them.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
             DEBUG shows all details including URLs, selectors, and data.
@@ -158,6 +531,12 @@ def setup_logging(
             format, "json" for structured JSON format.
         max_bytes: Maximum size of log file before rotation (default 10MB).
         backup_count: Number of backup files to keep (default 5).
+        flush_interval: Maximum seconds a buffered record waits before
+            being written (default 1.0). ERROR and above are written at once,
+            and a full 64 KiB buffer is written without waiting.
+        stream: Optional text stream (e.g. io.StringIO) that receives the
+            file-formatted output synchronously instead of a log file.
+            Takes precedence over log_file.
 
     Returns:
         The configured root logger instance.
@@ -167,12 +546,18 @@ def setup_logging(
         >>> logger = get_logger(__name__)
         >>> logger.info("Crawler started")
     """
+    global _queue_listener
+
     # Get the root logger for the crawler package
     root_logger = logging.getLogger("src")
     root_logger.setLevel(getattr(logging, level.upper()))
 
     # Clear existing handlers to avoid duplicates
     root_logger.handlers.clear()
+    _stop_queue_listener()
+
+    # Process-wide: undone by teardown_logging()
+    _apply_record_settings()
 
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
@@ -181,8 +566,15 @@ def setup_logging(
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
 
+    # Same output as the log file, written straight to a caller's stream
+    if stream is not None:
+        stream_handler = logging.StreamHandler(stream)
+        stream_handler.setLevel(logging.DEBUG)
+        stream_handler.setFormatter(_file_formatter(log_format))
+        root_logger.addHandler(stream_handler)
+
     # File handler (optional, with rotation)
-    if log_file:
+    elif log_file:
         # Determine log file path
         if log_dir:
             log_path = log_dir / log_file
@@ -192,21 +584,28 @@ def setup_logging(
             log_path = Path(log_file)
 
         # Create rotating file handler
-        file_handler = RotatingFileHandler(
+        file_handler = CountingRotatingFileHandler(
             log_path,
             maxBytes=max_bytes,
             backupCount=backup_count,
             encoding="utf-8",
+            buffer_size=FILE_BUFFER_SIZE,
         )
         file_handler.setLevel(logging.DEBUG)  # Capture all levels to file
-
-        # Set formatter based on format option
-        if log_format.lower() == "json":
-            file_formatter = JSONFormatter()
-        else:
-            file_formatter = logging.Formatter(FILE_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(_file_formatter(log_format))
+
+        # Callers only enqueue; the listener thread writes to disk
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_listener = BufferingQueueListener(
+            log_queue,
+            file_handler,
+            flush_interval=flush_interval,
+            respect_handler_level=True,
+        )
+        queue_handler = LocalQueueHandler(log_queue)
+        queue_handler.listener = _queue_listener
+        root_logger.addHandler(queue_handler)
+        _queue_listener.start()
 
     return root_logger
 
@@ -235,6 +634,43 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def teardown_logging() -> None:
+    """
+    Undo setup_logging().
+
+    Writes out and closes the log file, removes the crawler's handlers, and
+    restores the record factory and the logThreads/logProcesses flags that
+    setup_logging() changed for every logger in the process. Runs at exit.
+    """
+    _stop_queue_listener()
+    root_logger = logging.getLogger("src")
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+    _restore_record_settings()
+
+
+# Runs before logging's own atexit shutdown (atexit is LIFO)
+atexit.register(teardown_logging)
+
+
+def flush() -> None:
+    """
+    Write every record logged so far to the log file.
+
+    Waits for the background listener to empty the queue, then flushes the
+    file's write buffer. Logging keeps working afterwards. Useful before
+    reading the log file or handing it to another process.
+    """
+    listener = _queue_listener
+    if listener is None:
+        return
+    listener.stop()  # processes every queued record before returning
+    listener.start()
+    for handler in listener.handlers:
+        handler.flush()
+
+
 # Log level guidelines for reference
 LOG_LEVEL_GUIDELINES = """
 Log Level Guidelines
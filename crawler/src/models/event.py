@@ -1,57 +1,68 @@
 """Event data model matching Hugo front matter schema."""
 
+import functools
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 from slugify import slugify as _slugify
 
 
+@functools.lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """Convert text to URL-friendly ASCII slug.
 
     Uses python-slugify to transliterate all Unicode characters to ASCII,
     producing human-readable URLs without percent-encoded characters.
+    Results are cached: each event's slug is read several times (file
+    path, front matter) and venue names repeat across a crawl.
     """
     return _slugify(text)
 
 
+# Taxonomy day names by weekday() and month names by month, unaccented
+_FRENCH_DAY_SLUGS = (
+    "lundi",
+    "mardi",
+    "mercredi",
+    "jeudi",
+    "vendredi",
+    "samedi",
+    "dimanche",
+)
+_FRENCH_MONTH_SLUGS = (
+    None,
+    "janvier",
+    "fevrier",
+    "mars",
+    "avril",
+    "mai",
+    "juin",
+    "juillet",
+    "aout",
+    "septembre",
+    "octobre",
+    "novembre",
+    "decembre",
+)
+
+
 def format_french_date(dt: datetime) -> str:
     """Format date as French taxonomy slug: 'jour-DD-mois'."""
-    days = {
-        0: "lundi",
-        1: "mardi",
-        2: "mercredi",
-        3: "jeudi",
-        4: "vendredi",
-        5: "samedi",
-        6: "dimanche",
-    }
-    months = {
-        1: "janvier",
-        2: "fevrier",
-        3: "mars",
-        4: "avril",
-        5: "mai",
-        6: "juin",
-        7: "juillet",
-        8: "aout",
-        9: "septembre",
-        10: "octobre",
-        11: "novembre",
-        12: "decembre",
-    }
-    day_name = days[dt.weekday()]
-    month_name = months[dt.month]
+    day_name = _FRENCH_DAY_SLUGS[dt.weekday()]
+    month_name = _FRENCH_MONTH_SLUGS[dt.month]
     return f"{day_name}-{dt.day:02d}-{month_name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     Event data model matching Hugo front matter schema.
 
     This model represents a cultural event for the Massalia Events calendar.
     All fields align with the archetypes/events.md Hugo template.
+
+    Instances are slotted: a crawl holds every parsed event in memory, and
+    dropping the per-instance __dict__ keeps that footprint small.
     """
 
     # Required fields
@@ -108,7 +119,8 @@ class Event:
     @property
     def start_time(self) -> str:
         """Event start time in 24h format."""
-        return self.start_datetime.strftime("%H:%M")
+        dt = self.start_datetime
+        return f"{dt.hour:02d}:{dt.minute:02d}"
 
     @property
     def expiry_date(self) -> datetime:
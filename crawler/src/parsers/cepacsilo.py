@@ -60,7 +60,7 @@ def _extract_json_ld(html: str) -> list[dict]:
     """
     from bs4 import BeautifulSoup
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     results = []
 
     for script in soup.find_all("script", type="application/ld+json"):
@@ -91,7 +91,7 @@ def _parse_event_dates_from_html(html: str) -> list[datetime]:
     """
     from bs4 import BeautifulSoup
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     dates = []
 
     # French month mapping
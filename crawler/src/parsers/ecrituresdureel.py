@@ -60,7 +60,7 @@ def _parse_sidebar_dates(html: str) -> list[dict]:
     """
     from bs4 import BeautifulSoup
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     results = []
 
     sidebar = soup.select_one("aside#textSide")
@@ -90,7 +90,7 @@ def _extract_json_ld(html: str) -> list[dict]:
     """
     from bs4 import BeautifulSoup
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     results = []
 
     for script in soup.find_all("script", type="application/ld+json"):
@@ -131,6 +131,12 @@ MARSEILLE_VENUE_KEYWORDS = {
     "bernardines",
 }
 
+# Pattern to match HTML tags
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Pattern to collapse whitespace
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def _parse_french_date(text, reference_year=None):
     """
@@ -891,7 +897,7 @@ def _clean_html(html_text):
     if not html_text:
         return ""
     # Remove HTML tags
-    text = re.sub(r"<[^>]+>", "", html_text)
+    text = _HTML_TAG_RE.sub("", html_text)
     # Decode HTML entities
     text = text.replace("&amp;", "&")
     text = text.replace("&lt;", "<")
@@ -903,5 +909,5 @@ def _clean_html(html_text):
     text = text.replace("&#8221;", '"')
     text = text.replace("&nbsp;", " ")
     # Normalize whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     return text
@@ -115,7 +115,7 @@ def _parse_showtimes_from_html(html: str) -> list[dict]:
     """
     from bs4 import BeautifulSoup
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     showtimes = []
 
     # Strategy: find all text that matches date patterns, then look for
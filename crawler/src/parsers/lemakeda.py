@@ -33,6 +33,12 @@ TRIBE_API_BASE = "https://www.lemakeda.com/wp-json/tribe/events/v1"
 # Maximum events per API request (Tribe default max is 50)
 TRIBE_PER_PAGE = 50
 
+# Location slug shared by every Le Makeda event
+LOCATION_SLUG = "le-makeda"
+
+# Prefix for source IDs ("lemakeda:<tribe id or slug>")
+SOURCE_ID_PREFIX = "lemakeda:"
+
 
 class LeMakedaParser(BaseCrawler):
     """
@@ -47,16 +53,17 @@ class LeMakedaParser(BaseCrawler):
     """
 
     source_name = "Le Makeda"
+    fetches_listing_page = False
 
-    def parse_events(self, parser: HTMLParser) -> list[Event]:
+    def parse_events(self, parser: HTMLParser | None) -> list[Event]:
         """
         Parse events from Le Makeda using the Tribe Events REST API.
 
-        The HTMLParser argument from the base class crawl() method is
-        ignored since we fetch structured JSON from the API directly.
+        crawl() passes None since we fetch structured JSON from the API
+        directly; any HTMLParser given here is ignored.
 
         Args:
-            parser: HTMLParser (unused, required by base class interface)
+            parser: None in API mode (unused, required by base class interface)
 
         Returns:
             List of Event objects
@@ -70,11 +77,14 @@ class LeMakedaParser(BaseCrawler):
 
         logger.info(f"Fetched {len(api_events)} events from Le Makeda API")
 
+        # Bind per-event lookups once; pages hold up to TRIBE_PER_PAGE events
+        parse_event = self._parse_event
+        append = events.append
         for event_data in api_events:
             try:
-                event = self._parse_event(event_data)
+                event = parse_event(event_data)
                 if event:
-                    events.append(event)
+                    append(event)
             except Exception as e:
                 title = event_data.get("title", "unknown")
                 logger.warning(f"Failed to parse Le Makeda event '{title}': {e}")
@@ -187,7 +197,7 @@ class LeMakedaParser(BaseCrawler):
             description=description,
             image=image_url,
             categories=categories,
-            locations=["le-makeda"],
+            locations=[LOCATION_SLUG],
             tags=tags,
             source_id=source_id,
         )
@@ -203,19 +213,24 @@ class LeMakedaParser(BaseCrawler):
         """
         Extract start datetime from API data.
 
-        The Tribe API returns dates in format "2026-01-08 20:00:00".
+        The Tribe API returns dates in format "2026-01-08 20:00:00", which
+        datetime.fromisoformat parses natively (in C) on Python 3.11+.
+        Naive values are local Paris time.
         """
         start_date_str = data.get("start_date", "")
         if not start_date_str:
             return None
 
         try:
-            dt = datetime.strptime(start_date_str, "%Y-%m-%d %H:%M:%S")
-            return dt.replace(tzinfo=PARIS_TZ)
-        except ValueError:
+            dt = datetime.fromisoformat(start_date_str)
+        except (ValueError, TypeError):
             logger.debug(f"Could not parse date: {start_date_str}")
             return None
 
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=PARIS_TZ)
+        return dt
+
     def _extract_description(self, data: dict) -> str:
         """Extract and clean event description from API data."""
         description = data.get("description", "")
@@ -226,11 +241,9 @@ class LeMakedaParser(BaseCrawler):
                 description = excerpt
 
         if description:
-            clean = sanitize_description(description)
-            # Truncate to 160 chars for consistency
-            if len(clean) > 160:
-                clean = clean[:157] + "..."
-            return clean
+            # sanitize_description already collapses whitespace runs, so
+            # only a word-boundary truncation is left to do here
+            return HTMLParser.truncate(sanitize_description(description), 160)
 
         return ""
 
@@ -278,12 +291,12 @@ class LeMakedaParser(BaseCrawler):
         """Generate unique source ID from event data."""
         event_id = data.get("id", "")
         if event_id:
-            return f"lemakeda:{event_id}"
+            return f"{SOURCE_ID_PREFIX}{event_id}"
 
         # Fallback: use slug
         slug = data.get("slug", "")
         if slug:
-            return f"lemakeda:{slug}"
+            return f"{SOURCE_ID_PREFIX}{slug}"
 
         return ""
 
@@ -1,20 +1,59 @@
 """Parser for Le Zef - Scene nationale de Marseille events (lezef.org)."""
 
+import functools
 import json
+import re
 from datetime import datetime
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+import lxml.html
+from lxml import etree
 
 from ..crawler import BaseCrawler
 from ..logger import get_logger
 from ..models.event import Event
 from ..utils.french_date import PARIS_TZ, parse_french_time
+from ..utils.http import SSRFError
 from ..utils.parser import HTMLParser
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson is optional; its decode errors subclass json.JSONDecodeError
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# Performer names kept as tags per event
+MAX_PERFORMERS = 5
+
 # AJAX endpoint for fetching event listings
 AJAX_URL = "https://www.lezef.org/fr/saison_ajax"
 
+# Event cards in the AJAX listing (article.item-event) and the first link
+# inside each card's figure; compiled once, evaluated by libxml2
+_ITEM_EVENT_XPATH = etree.XPath(
+    "//article[contains(concat(' ', normalize-space(@class), ' '), ' item-event ')]"
+)
+_FIGURE_LINK_XPATH = etree.XPath("(.//figure//a[@href])[1]/@href")
+
+# Body of each <script type="application/ld+json"> block
+_JSON_LD_RE = re.compile(
+    r"<script\b[^>]*\btype\s*=\s*[\"']application/ld\+json[\"'][^>]*>"
+    r"(.*?)</script\s*>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _as_html_parser(html: str | HTMLParser) -> HTMLParser:
+    """Return an HTMLParser for html, parsing it only if given a raw string."""
+    if isinstance(html, HTMLParser):
+        return html
+    return HTMLParser(html, "")
+
 
 def _extract_event_urls_from_ajax_html(html: str, base_url: str = "") -> list[str]:
     """
@@ -28,16 +67,23 @@ def _extract_event_urls_from_ajax_html(html: str, base_url: str = "") -> list[st
         base_url: Base URL for resolving relative links
 
     Returns:
-        List of unique event detail URLs
+        List of unique event detail URLs, in listing order
     """
-    parser = HTMLParser(html, base_url)
-    urls = set()
+    if not html or not html.strip():
+        return []
+
+    try:
+        tree = lxml.html.fromstring(html)
+    except etree.ParserError:
+        # e.g. a response holding only comments: no elements to search
+        return []
+    # Insertion-ordered dict as an ordered set: dedup keeps first occurrence
+    urls: dict[str, None] = {}
 
     # Event detail links are in article.item-event > figure > a
-    for article in parser.select("article.item-event"):
-        link = article.select_one("figure a[href]")
-        if link:
-            href = link.get("href", "")
+    for article in _ITEM_EVENT_XPATH(tree):
+        for href in _FIGURE_LINK_XPATH(article):
+            href = str(href)
             if not href:
                 continue
 
@@ -47,9 +93,9 @@ def _extract_event_urls_from_ajax_html(html: str, base_url: str = "") -> list[st
 
             # Only include saison event pages
             if "/saison/" in href:
-                urls.add(href)
+                urls[href] = None
 
-    return sorted(urls)
+    return list(urls)
 
 
 def _extract_json_ld(html: str) -> dict | None:
@@ -60,19 +106,18 @@ def _extract_json_ld(html: str) -> dict | None:
     The JSON often contains CRLF line breaks inside string values that need
     to be escaped properly for JSON parsing.
 
+    The script blocks are found with a regex on the raw page, so callers
+    can skip building a parse tree for pages that carry no usable event.
+
     Args:
         html: HTML content
 
     Returns:
         Event JSON-LD dict or None if not found
     """
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    for script in soup.find_all("script", type="application/ld+json"):
+    for match in _JSON_LD_RE.finditer(html):
         try:
-            json_str = script.string
+            json_str = match.group(1).strip()
             if not json_str:
                 continue
 
@@ -82,7 +127,7 @@ def _extract_json_ld(html: str) -> dict | None:
             # This is a common issue with server-generated JSON.
             json_str = json_str.replace("\r\n", "\\n").replace("\r", "\\n")
 
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
             if isinstance(data, dict):
                 # Check for Event type directly
                 if data.get("@type") == "Event":
@@ -105,7 +150,21 @@ def _parse_iso_date(date_str: str) -> datetime | None:
         date_str: ISO format date string
 
     Returns:
-        datetime in Paris timezone, or None on failure
+        datetime in Paris timezone, or None on failure (including
+        non-string JSON-LD values)
+    """
+    if not isinstance(date_str, str):
+        return None
+    return _parse_iso_date_str(date_str)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso_date_str(date_str: str) -> datetime | None:
+    """
+    Memoized string path of _parse_iso_date.
+
+    A season's detail pages repeat the same start/end dates, and the
+    returned datetime is immutable so sharing it is safe.
     """
     try:
         # Handle full ISO datetime
@@ -113,7 +172,7 @@ def _parse_iso_date(date_str: str) -> datetime | None:
             date_str = date_str.split("T")[0]
         dt = datetime.strptime(date_str, "%Y-%m-%d")
         return dt.replace(tzinfo=PARIS_TZ)
-    except (ValueError, TypeError):
+    except ValueError:
         return None
 
 
@@ -135,28 +194,24 @@ def _extract_time_from_html(html: str) -> tuple[int, int] | None:
 
 def _generate_source_id(url: str) -> str:
     """Generate a unique source ID from an event URL."""
-    from urllib.parse import urlparse
-
-    parsed = urlparse(url)
-    path = parsed.path.strip("/")
-    segments = path.split("/")
-    event_slug = segments[-1] if segments else path
+    # Last path segment; urlsplit keeps any query string out of the slug
+    event_slug = urlsplit(url).path.rstrip("/").rpartition("/")[2]
     return f"lezef:{event_slug}"
 
 
-def _extract_category_from_html(html: str) -> str | None:
+def _extract_category_from_html(html: str | HTMLParser) -> str | None:
     """
     Extract event category from HTML.
 
     Le Zef uses <a class="danse">DANSE</a> style category links.
 
     Args:
-        html: HTML content
+        html: HTML content, or an already-parsed HTMLParser for the page
 
     Returns:
         Category text (lowercase) or None
     """
-    parser = HTMLParser(html, "")
+    parser = _as_html_parser(html)
 
     # Try category links in .category element
     for selector in ["p.category a", ".category a"]:
@@ -167,19 +222,19 @@ def _extract_category_from_html(html: str) -> str | None:
     return None
 
 
-def _extract_description_from_html(html: str) -> str:
+def _extract_description_from_html(html: str | HTMLParser) -> str:
     """
     Extract event description from HTML.
 
     Le Zef has description in the #presentation section.
 
     Args:
-        html: HTML content
+        html: HTML content, or an already-parsed HTMLParser for the page
 
     Returns:
         Truncated description text
     """
-    parser = HTMLParser(html, "")
+    parser = _as_html_parser(html)
 
     # Try meta description first
     meta = parser.select_one('meta[name="description"]')
@@ -199,29 +254,32 @@ def _extract_description_from_html(html: str) -> str:
     return ""
 
 
-def _extract_performer_from_html(html: str) -> list[str]:
+def _extract_performer_from_html(html: str | HTMLParser) -> list[str]:
     """
     Extract performer/artist names from HTML.
 
     Le Zef shows performers in p.artiste and p.compagnie elements.
 
     Args:
-        html: HTML content
+        html: HTML content, or an already-parsed HTMLParser for the page
 
     Returns:
         List of performer names (lowercase, for tags)
     """
-    parser = HTMLParser(html, "")
+    parser = _as_html_parser(html)
     performers = []
+    seen = set()
 
     for selector in ["p.artiste", "p.compagnie", ".artiste", ".compagnie"]:
-        elems = parser.select(selector)
-        for elem in elems:
-            text = elem.get_text().strip()
-            if text and text.lower() not in performers:
-                performers.append(text.lower())
+        for elem in parser.select(selector):
+            name = elem.get_text().strip().lower()
+            if name and name not in seen:
+                seen.add(name)
+                performers.append(name)
+                if len(performers) == MAX_PERFORMERS:
+                    return performers
 
-    return performers[:5]
+    return performers
 
 
 class LeZefParser(BaseCrawler):
@@ -241,16 +299,17 @@ class LeZefParser(BaseCrawler):
     """
 
     source_name = "Le Zef"
+    fetches_listing_page = False
 
-    def parse_events(self, parser: HTMLParser) -> list[Event]:
+    def parse_events(self, parser: HTMLParser | None) -> list[Event]:
         """
         Parse events from Le Zef.
 
         Note: The main URL is just for reference; actual events are
-        fetched via AJAX POST.
+        fetched via AJAX POST, so crawl() passes None here.
 
         Args:
-            parser: HTMLParser with the main page content (not used directly)
+            parser: None in AJAX mode (not used)
 
         Returns:
             List of Event objects
@@ -277,12 +336,15 @@ class LeZefParser(BaseCrawler):
         # Batch-fetch all detail pages concurrently
         pages = self.fetch_pages(event_urls)
 
+        # One reference time for the whole batch
+        now = datetime.now(PARIS_TZ)
+
         for event_url in event_urls:
             html = pages.get(event_url, "")
             if not html:
                 continue
             try:
-                event = self._parse_detail_page(event_url, html=html)
+                event = self._parse_detail_page(event_url, html=html, now=now)
                 if event:
                     events.append(event)
             except Exception as e:
@@ -298,28 +360,29 @@ class LeZefParser(BaseCrawler):
         Returns:
             HTML content or None on failure
         """
-        import requests
-
         try:
             # Extract season from base_url (e.g., "25-26" from ".../saison/25-26")
             season = "25-26"
             if "/saison/" in self.base_url:
                 season = self.base_url.split("/saison/")[-1].strip("/")
 
-            response = requests.post(
+            # Goes through the shared client so the POST reuses the pooled
+            # keep-alive connection used for the detail pages
+            response = self.http_client.post(
                 AJAX_URL,
                 data={"saisonAddr": season},
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
-                timeout=30,
             )
-            response.raise_for_status()
             return response.text
-        except requests.RequestException as e:
+        except (httpx.HTTPError, SSRFError) as e:
             logger.warning(f"AJAX request failed: {e}")
             return None
 
     def _parse_detail_page(
-        self, event_url: str, html: str | None = None
+        self,
+        event_url: str,
+        html: str | None = None,
+        now: datetime | None = None,
     ) -> Event | None:
         """
         Parse an event detail page.
@@ -327,6 +390,7 @@ class LeZefParser(BaseCrawler):
         Args:
             event_url: URL of the event detail page
             html: Pre-fetched HTML content (fetched if not provided)
+            now: Reference time for past/ongoing checks (defaults to now)
 
         Returns:
             Event object or None if parsing fails
@@ -337,7 +401,7 @@ class LeZefParser(BaseCrawler):
             logger.warning(f"Failed to fetch detail page: {event_url}")
             return None
 
-        # Extract JSON-LD for base event info
+        # Extract JSON-LD for base event info (regex on the raw page)
         json_ld = _extract_json_ld(html)
         if not json_ld:
             logger.debug(f"No Event JSON-LD found on: {event_url}")
@@ -371,7 +435,8 @@ class LeZefParser(BaseCrawler):
             start_datetime = start_datetime.replace(hour=20, minute=0)
 
         # Handle past events - check if it's an ongoing exhibition
-        now = datetime.now(PARIS_TZ)
+        if now is None:
+            now = datetime.now(PARIS_TZ)
         is_ongoing_exhibition = False
         if start_datetime < now:
             # Check if there's an endDate in the future (ongoing exhibition)
@@ -393,12 +458,16 @@ class LeZefParser(BaseCrawler):
                 logger.debug(f"Skipping past event: {name} ({start_datetime})")
                 return None
 
+        # Parse the page only for events we keep, and share the tree with
+        # every remaining extractor
+        page = HTMLParser(html, event_url)
+
         # Extract description (prefer JSON-LD, fallback to HTML)
         description = json_ld.get("description", "").strip()
         if description:
             description = HTMLParser.truncate(description, 160)
         else:
-            description = _extract_description_from_html(html)
+            description = _extract_description_from_html(page)
 
         # Extract image
         image = json_ld.get("image", "")
@@ -408,7 +477,7 @@ class LeZefParser(BaseCrawler):
             image = image.get("url", "")
 
         # Extract category from HTML (more reliable)
-        category = _extract_category_from_html(html)
+        category = _extract_category_from_html(page)
         if category:
             category = self.map_category(category)
         else:
@@ -418,7 +487,7 @@ class LeZefParser(BaseCrawler):
         source_id = _generate_source_id(event_url)
 
         # Extract performers as tags
-        tags = _extract_performer_from_html(html)
+        tags = _extract_performer_from_html(page)
 
         # Also add performers from JSON-LD
         performer = json_ld.get("performer", [])
@@ -1,8 +1,10 @@
 """Parser for Théâtre de l'Œuvre events."""
 
+import functools
+import json
 import re
 from datetime import datetime
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 from ..crawler import BaseCrawler
 from ..logger import get_logger
@@ -12,6 +14,52 @@ from ..utils.parser import HTMLParser
 
 logger = get_logger(__name__)
 
+# "31 janvier 2026" and "samedi 31 janvier" / "31 janvier"
+_DATE_WITH_YEAR_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})")
+_DATE_WITHOUT_YEAR_RE = re.compile(r"(\d{1,2})\s+(\w+)\b")
+
+# Separators in multi-value genres ("Rap - Jazz") and breadcrumb labels
+# ("Catégorie : Musique")
+_GENRE_SEPARATOR_RE = re.compile(r"\s*[-–/,]\s*")
+_CATEGORY_LABEL_RE = re.compile(r"[Cc]at[ée]gorie\s*:\s*(.+)")
+
+# Detail pages repeat the same short texts (navigation, venue address,
+# tariffs), and _extract_datetime tries every one of them
+_cached_parse_time = functools.lru_cache(maxsize=512)(parse_french_time)
+
+
+@functools.lru_cache(maxsize=512)
+def _match_french_date(text_lower: str) -> tuple[int, int, int | None] | None:
+    """
+    Find a French day-month(-year) date in lowercase text.
+
+    Only the text matching is cached; year inference for dates without a
+    year depends on today's date and is left to the caller.
+
+    Returns:
+        (day, month, year) with year None when absent, or None
+    """
+    with_year = _DATE_WITH_YEAR_RE.search(text_lower)
+    if with_year:
+        day = int(with_year.group(1))
+        month = FRENCH_MONTHS.get(with_year.group(2))
+        year = int(with_year.group(3))
+        if month:
+            try:
+                datetime(year, month, day)
+                return day, month, year
+            except ValueError:
+                pass
+
+    without_year = _DATE_WITHOUT_YEAR_RE.search(text_lower)
+    if without_year:
+        day = int(without_year.group(1))
+        month = FRENCH_MONTHS.get(without_year.group(2))
+        if month:
+            return day, month, None
+
+    return None
+
 
 class LoeuvreParser(BaseCrawler):
     """
@@ -258,43 +306,21 @@ class LoeuvreParser(BaseCrawler):
         if not text:
             return None
 
-        text_lower = text.lower()
-
-        # Pattern with year: "31 janvier 2026"
-        with_year = re.search(
-            r"(\d{1,2})\s+(\w+)\s+(\d{4})", text_lower
-        )
-        if with_year:
-            day = int(with_year.group(1))
-            month_name = with_year.group(2)
-            year = int(with_year.group(3))
-            month = FRENCH_MONTHS.get(month_name)
-            if month:
-                try:
-                    return datetime(year, month, day)
-                except ValueError:
-                    pass
-
-        # Pattern without year: "samedi 31 janvier" or "31 janvier"
-        without_year = re.search(
-            r"(\d{1,2})\s+(\w+)\b", text_lower
-        )
-        if without_year:
-            day = int(without_year.group(1))
-            month_name = without_year.group(2)
-            month = FRENCH_MONTHS.get(month_name)
-            if month:
-                year = self._infer_year(month, day)
-                try:
-                    return datetime(year, month, day)
-                except ValueError:
-                    pass
+        match = _match_french_date(text.lower())
+        if not match:
+            return None
 
-        return None
+        day, month, year = match
+        if year is None:
+            year = self._infer_year(month, day)
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            return None
 
     def _parse_time(self, text: str) -> tuple[int, int] | None:
         """Extract time from text. Delegates to shared utility."""
-        return parse_french_time(text)
+        return _cached_parse_time(text)
 
     def _infer_year(self, month: int, day: int) -> int:
         """Infer the year for a date without year. Delegates to shared utility."""
@@ -351,7 +377,7 @@ class LoeuvreParser(BaseCrawler):
                 if dd:
                     # Genre may contain multiple values like "Rap - Jazz"
                     genre_text = dd.get_text().strip()
-                    for part in re.split(r"\s*[-–/,]\s*", genre_text):
+                    for part in _GENRE_SEPARATOR_RE.split(genre_text):
                         part = part.strip()
                         if part:
                             mapped = self.map_category(part)
@@ -363,7 +389,7 @@ class LoeuvreParser(BaseCrawler):
             text = link.get_text().strip()
             if "catégorie" in text.lower() or "categorie" in text.lower():
                 # Extract category name after the colon
-                cat_match = re.search(r"[Cc]at[ée]gorie\s*:\s*(.+)", text)
+                cat_match = _CATEGORY_LABEL_RE.search(text)
                 if cat_match:
                     mapped = self.map_category(cat_match.group(1).strip())
                     if mapped != "communaute":
@@ -372,8 +398,6 @@ class LoeuvreParser(BaseCrawler):
         # Try JSON-LD breadcrumb data
         for script in parser.select('script[type="application/ld+json"]'):
             try:
-                import json
-
                 data = json.loads(script.string or "")
                 breadcrumb = data if data.get("@type") == "BreadcrumbList" else None
                 if not breadcrumb and isinstance(data, dict):
@@ -381,9 +405,7 @@ class LoeuvreParser(BaseCrawler):
                 if breadcrumb:
                     for item in breadcrumb.get("itemListElement", []):
                         name = item.get("name", "")
-                        cat_match = re.search(
-                            r"[Cc]at[ée]gorie\s*:\s*(.+)", name
-                        )
+                        cat_match = _CATEGORY_LABEL_RE.search(name)
                         if cat_match:
                             mapped = self.map_category(cat_match.group(1).strip())
                             if mapped != "communaute":
@@ -409,7 +431,7 @@ class LoeuvreParser(BaseCrawler):
                 dd = dt.find_next_sibling("dd")
                 if dd:
                     genre_text = dd.get_text().strip()
-                    for part in re.split(r"\s*[-–/,]\s*", genre_text):
+                    for part in _GENRE_SEPARATOR_RE.split(genre_text):
                         part = part.strip().lower()
                         if part and part not in tags:
                             tags.append(part)
@@ -417,7 +439,7 @@ class LoeuvreParser(BaseCrawler):
         # Extract category from breadcrumbs
         for link in parser.select("a"):
             text = link.get_text().strip()
-            cat_match = re.search(r"[Cc]at[ée]gorie\s*:\s*(.+)", text)
+            cat_match = _CATEGORY_LABEL_RE.search(text)
             if cat_match:
                 cat = cat_match.group(1).strip().lower()
                 if cat and cat not in tags:
@@ -445,8 +467,6 @@ class LoeuvreParser(BaseCrawler):
 
     def _generate_source_id(self, url: str) -> str:
         """Generate unique source ID from URL."""
-        from urllib.parse import urlparse
-
         parsed = urlparse(url)
         path = parsed.path.strip("/")
 
@@ -66,7 +66,7 @@ def _extract_json_ld(html: str) -> dict | None:
     """
     from bs4 import BeautifulSoup
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
 
     for script in soup.find_all("script", type="application/ld+json"):
         try:
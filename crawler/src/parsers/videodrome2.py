@@ -32,7 +32,7 @@ def _extract_event_urls_from_html(html: str, base_url: str = "") -> list[str]:
     """
     from bs4 import BeautifulSoup
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     urls = set()
 
     # Event items contain links with event detail URLs
@@ -72,7 +72,7 @@ def _extract_json_ld(html: str) -> list[dict]:
     """
     from bs4 import BeautifulSoup
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     results = []
 
     for script in soup.find_all("script", type="application/ld+json"):
@@ -3,14 +3,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from zoneinfo import ZoneInfo
 
 import yaml
 
 from .logger import get_logger
-
-# Paris timezone for Marseille events
-PARIS_TZ = ZoneInfo("Europe/Paris")
+from .utils.french_date import PARIS_TZ
+from .utils.yaml import safe_load
 
 logger = get_logger(__name__)
 
@@ -354,7 +352,7 @@ def load_selection_criteria(config_path: Path) -> SelectionCriteria:
 
     try:
         with open(config_path, encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
+            raw = safe_load(f)
     except yaml.YAMLError as e:
         raise SelectionError(f"Invalid YAML in selection criteria: {e}") from e
 
@@ -53,6 +53,28 @@ FRENCH_DAYS: dict[str, int] = {
 DEFAULT_HOUR = 20
 DEFAULT_MINUTE = 0
 
+# Time patterns: "19h", "19h30", "19H30" (French style) and "19:30"
+_FRENCH_TIME_RE = re.compile(r"(\d{1,2})[hH](\d{2})?")
+_COLON_TIME_RE = re.compile(r"\b(\d{1,2}):(\d{2})\b")
+
+# Single-date patterns: "Du DD mois au DD mois YYYY", "DD mois YYYY", "DD mois"
+_DATE_RANGE_RE = re.compile(
+    r"du\s+(\d{1,2})\s+(\w+)(?:\s+au\s+\d{1,2}\s+\w+)?\s+(\d{4})"
+)
+_DATE_WITH_YEAR_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})")
+_DATE_WITHOUT_YEAR_RE = re.compile(r"(\d{1,2})\s+(\w+)\b")
+
+# Multi-date patterns used by parse_all_french_dates
+_A_VENIR_PREFIX_RE = re.compile(r"^[àa]\s+venir\s*")
+_DAY_RANGE_RE = re.compile(
+    r"du\s+(\d{1,2})\s+(?:\w+\s+)?au\s+(\d{1,2})\s+(\w+)(?:\s+(\d{4}))?"
+)
+_DAY_LIST_RE = re.compile(
+    r"((?:\d{1,2}\s*,\s*)*\d{1,2})\s+et\s+(\d{1,2})\s+(\w+)(?:\s+(\d{4}))?"
+)
+_DAY_NUMBER_RE = re.compile(r"\d{1,2}")
+_JUSQUAU_RE = re.compile(r"jusqu[''']?\s*au\s+(\d{1,2})\s+(\w+)(?:\s+(\d{4}))?")
+
 
 def parse_french_date(
     text: str,
@@ -94,8 +116,7 @@ def parse_french_date(
         hour, minute = time_result
 
     # Pattern for date range: "Du DD mois au DD mois YYYY"
-    range_pattern = r"du\s+(\d{1,2})\s+(\w+)(?:\s+au\s+\d{1,2}\s+\w+)?\s+(\d{4})"
-    match = re.search(range_pattern, text_lower)
+    match = _DATE_RANGE_RE.search(text_lower)
     if match:
         day = int(match.group(1))
         month_name = match.group(2)
@@ -108,8 +129,7 @@ def parse_french_date(
                 pass
 
     # Pattern for single date with year: "DD mois YYYY"
-    with_year_pattern = r"(\d{1,2})\s+(\w+)\s+(\d{4})"
-    match = re.search(with_year_pattern, text_lower)
+    match = _DATE_WITH_YEAR_RE.search(text_lower)
     if match:
         day = int(match.group(1))
         month_name = match.group(2)
@@ -122,8 +142,7 @@ def parse_french_date(
                 pass
 
     # Pattern for single date without year: "DD mois"
-    without_year_pattern = r"(\d{1,2})\s+(\w+)\b"
-    match = re.search(without_year_pattern, text_lower)
+    match = _DATE_WITHOUT_YEAR_RE.search(text_lower)
     if match:
         day = int(match.group(1))
         month_name = match.group(2)
@@ -159,7 +178,7 @@ def parse_french_time(text: str) -> tuple[int, int] | None:
         return None
 
     # Match "HHhMM" or "HHh" format (French style)
-    match = re.search(r"(\d{1,2})[hH](\d{2})?", text)
+    match = _FRENCH_TIME_RE.search(text)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2)) if match.group(2) else 0
@@ -167,7 +186,7 @@ def parse_french_time(text: str) -> tuple[int, int] | None:
             return (hour, minute)
 
     # Match "HH:MM" format
-    match = re.search(r"\b(\d{1,2}):(\d{2})\b", text)
+    match = _COLON_TIME_RE.search(text)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2))
@@ -211,13 +230,10 @@ def parse_all_french_dates(
     text_clean = text.strip().lower()
 
     # Remove "a venir" prefix
-    text_clean = re.sub(r"^[àa]\s+venir\s*", "", text_clean).strip()
+    text_clean = _A_VENIR_PREFIX_RE.sub("", text_clean).strip()
 
     # Pattern: "Du DD au DD mois [YYYY]" - expand to all dates in range
-    range_match = re.search(
-        r"du\s+(\d{1,2})\s+(?:\w+\s+)?au\s+(\d{1,2})\s+(\w+)(?:\s+(\d{4}))?",
-        text_clean,
-    )
+    range_match = _DAY_RANGE_RE.search(text_clean)
     if range_match:
         start_day = int(range_match.group(1))
         end_day = int(range_match.group(2))
@@ -244,10 +260,7 @@ def parse_all_french_dates(
                 return dates
 
     # Pattern: "DD, DD et DD mois [YYYY]" (list with commas and 'et')
-    list_match = re.search(
-        r"((?:\d{1,2}\s*,\s*)*\d{1,2})\s+et\s+(\d{1,2})\s+(\w+)(?:\s+(\d{4}))?",
-        text_clean,
-    )
+    list_match = _DAY_LIST_RE.search(text_clean)
     if list_match:
         days_before_et = list_match.group(1)
         last_day = int(list_match.group(2))
@@ -257,7 +270,7 @@ def parse_all_french_dates(
         if month:
             dates = []
             # Parse all days before 'et'
-            for day_str in re.findall(r"\d{1,2}", days_before_et):
+            for day_str in _DAY_NUMBER_RE.findall(days_before_et):
                 try:
                     dates.append(
                         datetime(
@@ -289,10 +302,7 @@ def parse_all_french_dates(
                 return dates
 
     # Pattern: "Jusqu'au DD mois [YYYY]"
-    jusquau_match = re.search(
-        r"jusqu[''']?\s*au\s+(\d{1,2})\s+(\w+)(?:\s+(\d{4}))?",
-        text_clean,
-    )
+    jusquau_match = _JUSQUAU_RE.search(text_clean)
     if jusquau_match:
         day = int(jusquau_match.group(1))
         month_name = jusquau_match.group(2)
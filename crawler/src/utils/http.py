@@ -483,15 +483,42 @@ class HTTPClient:
         Raises:
             httpx.HTTPError: If all retries fail
         """
+        return self._request("GET", url)
+
+    def post(
+        self,
+        url: str,
+        data: dict | None = None,
+        headers: dict | None = None,
+    ) -> httpx.Response:
+        """
+        Make a POST request with retries over the pooled connection.
+
+        Args:
+            url: URL to post to
+            data: Form fields to send in the request body
+            headers: Extra request headers
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            httpx.HTTPError: If all retries fail
+        """
+        return self._request("POST", url, data=data, headers=headers)
+
+    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request with SSRF validation, rate limiting and retries."""
         validate_url(url)  # raises SSRFError for disallowed URLs
 
         self._wait_for_rate_limit()
 
+        send = getattr(self._client, method.lower())
         last_error = None
         for attempt in range(self.retry_count + 1):
             try:
-                logger.debug(f"GET {url} (attempt {attempt + 1})")
-                response = self._client.get(url)
+                logger.debug(f"{method} {url} (attempt {attempt + 1})")
+                response = send(url, **kwargs)
                 response.raise_for_status()
                 self._last_request_time = time.time()
                 return response
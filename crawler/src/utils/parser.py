@@ -10,6 +10,17 @@ from ..logger import get_logger
 
 logger = get_logger(__name__)
 
+# "26 janvier 2026" or "26 janvier"
+_FRENCH_DATE_RE = re.compile(r"(\d{1,2})\s+(\w+)(?:\s+(\d{4}))?")
+# "26/01/2026", "26/01/26" or "26/01"
+_SLASH_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?")
+# Time formats, tried in order
+_TIME_RES = (
+    re.compile(r"(\d{1,2})[hH:](\d{2})"),  # 19h30, 19:30
+    re.compile(r"(\d{1,2})\s*[hH]"),  # 19h, 19 h
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class HTMLParser:
     """
@@ -182,8 +193,7 @@ class HTMLParser:
         text = text.strip().lower()
 
         # Try French date pattern first: "26 janvier 2026" or "26 janvier"
-        french_pattern = r"(\d{1,2})\s+(\w+)(?:\s+(\d{4}))?"
-        match = re.search(french_pattern, text)
+        match = _FRENCH_DATE_RE.search(text)
         if match:
             day = int(match.group(1))
             month_name = match.group(2)
@@ -197,8 +207,7 @@ class HTMLParser:
                     pass
 
         # Try slash date pattern: "26/01/2026" or "26/01/26" or "26/01"
-        slash_pattern = r"(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?"
-        match = re.search(slash_pattern, text)
+        match = _SLASH_DATE_RE.search(text)
         if match:
             day = int(match.group(1))
             month = int(match.group(2))
@@ -246,13 +255,8 @@ class HTMLParser:
             return None
 
         # Match various time formats
-        patterns = [
-            r"(\d{1,2})[hH:](\d{2})",  # 19h30, 19:30
-            r"(\d{1,2})\s*[hH]",  # 19h, 19 h
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _TIME_RES:
+            match = pattern.search(text)
             if match:
                 hour = int(match.group(1))
                 minute = int(match.group(2)) if len(match.groups()) > 1 else 0
@@ -274,7 +278,7 @@ class HTMLParser:
         if not text:
             return ""
         # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
         return text.strip()
 
     @staticmethod
@@ -291,5 +295,9 @@ class HTMLParser:
         """
         if len(text) <= max_length:
             return text
-        truncated = text[: max_length - 3].rsplit(" ", 1)[0]
+        truncated = text[: max_length - 3]
+        # Cut at the last space, without splitting off the tail
+        cut = truncated.rfind(" ")
+        if cut != -1:
+            truncated = truncated[:cut]
         return truncated + "..."
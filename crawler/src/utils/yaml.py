@@ -0,0 +1,15 @@
+"""YAML loading with libyaml's C loader when PyYAML was built with it."""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml; same results, slower
+    from yaml import SafeLoader as _YamlLoader
+
+
+def safe_load(stream: str | IO) -> Any:
+    """Parse a YAML document like yaml.safe_load, using the fastest safe loader."""
+    return yaml.load(stream, Loader=_YamlLoader)
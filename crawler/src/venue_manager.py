@@ -10,9 +10,8 @@ from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from pathlib import Path
 
-import yaml
-
 from .logger import get_logger
+from .utils.yaml import safe_load
 
 logger = get_logger(__name__)
 
@@ -112,7 +111,7 @@ class VenueManager:
             return
 
         with open(self.venues_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = safe_load(f)
 
         if isinstance(data, list):
             self.venues = data
@@ -323,7 +322,7 @@ class VenueManager:
                 if not text.startswith("---"):
                     continue
                 end = text.index("---", 3)
-                front_matter = yaml.safe_load(text[3:end])
+                front_matter = safe_load(text[3:end])
                 if front_matter and isinstance(front_matter.get("locations"), list):
                     for loc in front_matter["locations"]:
                         if loc and loc not in known_slugs:
@@ -39,6 +39,12 @@ class TestSlugify:
         assert slugify("Event #1 - 2026!") == "event-1-2026"
         assert slugify("Concert @ La Friche") == "concert-la-friche"
 
+    def test_repeated_text_is_cached(self):
+        slugify.cache_clear()
+        assert slugify("Théâtre du Gymnase") == "theatre-du-gymnase"
+        assert slugify("Théâtre du Gymnase") == "theatre-du-gymnase"
+        assert slugify.cache_info().hits == 1
+
     def test_multiple_spaces(self):
         assert slugify("Hello   World") == "hello-world"
 
@@ -392,6 +392,46 @@ class TestHTTPClient:
         assert data == b"binary data"
         client.close()
 
+    @patch("httpx.Client")
+    def test_post(self, mock_client_class):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "<div>events</div>"
+
+        mock_client = MagicMock()
+        mock_client.post.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        client = HTTPClient()
+        response = client.post("https://example.com/ajax", data={"key": "value"})
+
+        assert response.text == "<div>events</div>"
+        mock_client.post.assert_called_once_with(
+            "https://example.com/ajax", data={"key": "value"}, headers=None
+        )
+        client.close()
+
+    @patch("httpx.Client")
+    def test_post_retries_on_5xx(self, mock_client_class):
+        request = httpx.Request("POST", "https://example.com/ajax")
+        mock_response_fail = MagicMock()
+        mock_response_fail.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Server error", request=request, response=httpx.Response(503)
+        )
+        mock_response_success = MagicMock()
+        mock_response_success.text = "ok"
+
+        mock_client = MagicMock()
+        mock_client.post.side_effect = [mock_response_fail, mock_response_success]
+        mock_client_class.return_value = mock_client
+
+        client = HTTPClient(retry_count=2, retry_delay=0.01)
+        response = client.post("https://example.com/ajax")
+
+        assert mock_client.post.call_count == 2
+        assert response.text == "ok"
+        client.close()
+
 
 class TestHTTPClientIntegration:
     """Integration tests for HTTPClient (require network)."""
@@ -572,6 +612,12 @@ class TestValidateUrlInHTTPClient:
             client.get_bytes("http://192.168.1.1/image.jpg")
         client.close()
 
+    def test_post_raises_for_private_ip(self):
+        client = HTTPClient()
+        with pytest.raises(SSRFError):
+            client.post("http://10.0.0.1/ajax", data={"key": "value"})
+        client.close()
+
 
 # ── Test thread-safe RateLimiter ────────────────────────────────────
 
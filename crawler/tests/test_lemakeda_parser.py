@@ -2,20 +2,18 @@
 
 import json
 from datetime import datetime
-from unittest.mock import MagicMock
-from zoneinfo import ZoneInfo
+from unittest.mock import Mock
 
 import pytest
 
+from src.generators.markdown import MarkdownGenerator
 from src.models.event import Event
-from src.parsers.lemakeda import LeMakedaParser
-from src.utils.http import FetchResult
+from src.parsers.lemakeda import PARIS_TZ, LeMakedaParser
+from src.utils.http import FetchResult, HTTPClient
+from src.utils.images import ImageDownloader
 from src.utils.parser import HTMLParser
 from src.utils.sanitize import sanitize_description
 
-PARIS_TZ = ZoneInfo("Europe/Paris")
-
-
 # ── Fixtures ────────────────────────────────────────────────────────
 
 
@@ -193,9 +191,9 @@ def mock_config():
 @pytest.fixture
 def parser(mock_config):
     """Create a LeMakedaParser instance with mocked dependencies."""
-    http_client = MagicMock()
-    image_downloader = MagicMock()
-    markdown_generator = MagicMock()
+    http_client = Mock(spec=HTTPClient)
+    image_downloader = Mock(spec=ImageDownloader)
+    markdown_generator = Mock(spec=MarkdownGenerator)
     return LeMakedaParser(
         config=mock_config,
         http_client=http_client,
@@ -390,37 +388,38 @@ class TestFetchApiEvents:
         events = parser._fetch_api_events()
         assert len(events) == 2
 
+    @staticmethod
+    def _paged_responses(pages):
+        """Yield one FetchResult per page, built lazily as the parser asks."""
+        total_pages = len(pages)
+        total = sum(len(events) for events in pages)
+        for number, events in enumerate(pages, start=1):
+            yield FetchResult(
+                url=f"url{number}",
+                status_code=200,
+                html=json.dumps(
+                    {"events": events, "total": total, "total_pages": total_pages}
+                ),
+                headers={},
+            )
+
     def test_handles_multi_page(
         self, parser, sample_api_event, sample_api_event_dj_set
     ):
-        page1_response = {
-            "events": [sample_api_event],
-            "total": 2,
-            "total_pages": 2,
-        }
-        page2_response = {
-            "events": [sample_api_event_dj_set],
-            "total": 2,
-            "total_pages": 2,
-        }
-        parser.http_client.fetch.side_effect = [
-            FetchResult(
-                url="url1",
-                status_code=200,
-                html=json.dumps(page1_response),
-                headers={},
-            ),
-            FetchResult(
-                url="url2",
-                status_code=200,
-                html=json.dumps(page2_response),
-                headers={},
-            ),
-        ]
+        parser.http_client.fetch.side_effect = self._paged_responses(
+            [[sample_api_event], [sample_api_event_dj_set]]
+        )
         events = parser._fetch_api_events()
         assert len(events) == 2
         assert parser.http_client.fetch.call_count == 2
 
+    def test_handles_many_pages(self, parser, sample_api_event):
+        pages = [[{**sample_api_event, "id": page}] for page in range(1, 41)]
+        parser.http_client.fetch.side_effect = self._paged_responses(pages)
+        events = parser._fetch_api_events()
+        assert [event["id"] for event in events] == list(range(1, 41))
+        assert parser.http_client.fetch.call_count == 40
+
     def test_handles_api_error(self, parser):
         parser.http_client.fetch.return_value = FetchResult(
             url="url",
@@ -605,9 +604,8 @@ class TestParseEventsIntegration:
             headers={},
         )
 
-        # parse_events receives an HTMLParser but ignores it for API parsing
-        html_parser = HTMLParser("<html></html>", "https://www.lemakeda.com")
-        events = parser.parse_events(html_parser)
+        # crawl() passes None in API mode
+        events = parser.parse_events(None)
 
         assert len(events) == 2
         assert all(isinstance(e, Event) for e in events)
@@ -615,8 +613,7 @@ class TestParseEventsIntegration:
     def test_parse_events_handles_api_failure(self, parser):
         parser.http_client.fetch.side_effect = Exception("Network error")
 
-        html_parser = HTMLParser("<html></html>", "https://www.lemakeda.com")
-        events = parser.parse_events(html_parser)
+        events = parser.parse_events(None)
         assert events == []
 
     def test_parse_events_skips_invalid_events(self, parser):
@@ -653,11 +650,36 @@ class TestParseEventsIntegration:
             headers={},
         )
 
-        html_parser = HTMLParser("<html></html>", "https://www.lemakeda.com")
-        events = parser.parse_events(html_parser)
+        events = parser.parse_events(None)
         assert len(events) == 1
         assert events[0].name == "Valid Event"
 
+    def test_parse_events_ignores_html_parser(self, parser, sample_api_response):
+        parser.http_client.fetch.return_value = FetchResult(
+            url="url",
+            status_code=200,
+            html=json.dumps(sample_api_response),
+            headers={},
+        )
+
+        html_parser = HTMLParser("<html></html>", "https://www.lemakeda.com")
+        events = parser.parse_events(html_parser)
+        assert len(events) == 2
+
+    def test_crawl_skips_listing_page_fetch(self, parser, sample_api_response):
+        parser.http_client.fetch.return_value = FetchResult(
+            url="url",
+            status_code=200,
+            html=json.dumps(sample_api_response),
+            headers={},
+        )
+        parser.markdown_generator.find_by_source_id.return_value = None
+
+        events = parser.crawl()
+
+        assert len(events) == 2
+        parser.http_client.get_text.assert_not_called()
+
     def test_source_name(self, parser):
         assert parser.source_name == "Le Makeda"
 
@@ -738,6 +760,12 @@ class TestExtractDatetime:
         result = parser._extract_datetime(data)
         assert result.tzinfo == PARIS_TZ
 
+    def test_keeps_explicit_offset(self, parser):
+        data = {"start_date": "2026-06-15T21:00:00+02:00"}
+        result = parser._extract_datetime(data)
+        assert result.hour == 21
+        assert result.utcoffset().total_seconds() == 7200
+
 
 # ── Test _generate_source_id ────────────────────────────────────────
 
@@ -1,13 +1,16 @@
 """Tests for the Le Zef - Scene nationale de Marseille parser."""
 
 import json
-from unittest.mock import MagicMock, patch
-from zoneinfo import ZoneInfo
+from datetime import datetime
+from types import MappingProxyType
+from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
 from src.models.event import Event
 from src.parsers.lezef import (
+    PARIS_TZ,
     LeZefParser,
     _extract_category_from_html,
     _extract_description_from_html,
@@ -20,13 +23,10 @@ from src.parsers.lezef import (
 )
 from src.utils.parser import HTMLParser
 
-PARIS_TZ = ZoneInfo("Europe/Paris")
-
-
 # ── Fixtures ────────────────────────────────────────────────────────
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ajax_html():
     """Sample Le Zef AJAX listing response with event cards."""
     return """
@@ -83,7 +83,7 @@ def sample_ajax_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_detail_html():
     """Sample Le Zef event detail page with JSON-LD."""
     json_ld = json.dumps(
@@ -139,7 +139,7 @@ def sample_detail_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_detail_with_time():
     """Sample detail page with specific showtime."""
     json_ld = json.dumps(
@@ -171,23 +171,19 @@ def sample_detail_with_time():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def category_map():
-    """Standard category mapping from sources.yaml."""
-    return {
-        "danse": "danse",
-        "DANSE": "danse",
-        "musique": "musique",
-        "MUSIQUE": "musique",
-        "theatre": "theatre",
-        "THEATRE": "theatre",
-        "expo": "art",
-        "EXPO": "art",
-        "cuisine": "communaute",
-        "CUISINE": "communaute",
-        "cirque": "theatre",
-        "CIRQUE": "theatre",
-    }
+    """Standard category mapping from sources.yaml (read-only, shared)."""
+    return MappingProxyType(
+        {
+            "danse": "danse",
+            "musique": "musique",
+            "theatre": "theatre",
+            "expo": "art",
+            "cuisine": "communaute",
+            "cirque": "theatre",
+        }
+    )
 
 
 # ── Test _extract_event_urls_from_ajax_html ───────────────────────
@@ -229,6 +225,10 @@ class TestExtractEventUrlsFromAjax:
         urls = _extract_event_urls_from_ajax_html("<html><body></body></html>")
         assert urls == []
 
+    def test_handles_blank_response(self):
+        assert _extract_event_urls_from_ajax_html("") == []
+        assert _extract_event_urls_from_ajax_html("<!-- no events -->") == []
+
     def test_deduplicates_urls(self):
         html = """
         <article class="item-event">
@@ -241,6 +241,18 @@ class TestExtractEventUrlsFromAjax:
         urls = _extract_event_urls_from_ajax_html(html, "https://www.lezef.org")
         assert len(urls) == 1
 
+    def test_preserves_listing_order(self):
+        html = """
+        <article class="item-event"><figure><a href="/fr/saison/25-26/zz">Z</a></figure></article>
+        <article class="item-event"><figure><a href="/fr/saison/25-26/aa">A</a></figure></article>
+        <article class="item-event"><figure><a href="/fr/saison/25-26/zz">Z</a></figure></article>
+        """
+        urls = _extract_event_urls_from_ajax_html(html, "https://www.lezef.org")
+        assert urls == [
+            "https://www.lezef.org/fr/saison/25-26/zz",
+            "https://www.lezef.org/fr/saison/25-26/aa",
+        ]
+
 
 # ── Test _extract_json_ld ─────────────────────────────────────────
 
@@ -271,6 +283,16 @@ class TestExtractJsonLd:
         assert result is not None
         assert result["name"] == "Direct Event"
 
+    def test_matches_any_attribute_order(self):
+        json_ld = json.dumps({"@type": "Event", "name": "Direct Event"})
+        html = (
+            "<html><head><SCRIPT id='ld' type='application/ld+json'>\n"
+            f"{json_ld}\n</SCRIPT></head></html>"
+        )
+        result = _extract_json_ld(html)
+        assert result is not None
+        assert result["name"] == "Direct Event"
+
 
 # ── Test _parse_iso_date ──────────────────────────────────────────
 
@@ -284,7 +306,7 @@ class TestParseIsoDate:
         assert dt.year == 2026
         assert dt.month == 3
         assert dt.day == 15
-        assert dt.tzinfo == PARIS_TZ
+        assert dt.tzinfo is PARIS_TZ
 
     def test_parses_date_with_time(self):
         dt = _parse_iso_date("2026-03-15T20:00:00")
@@ -300,6 +322,13 @@ class TestParseIsoDate:
         dt = _parse_iso_date("")
         assert dt is None
 
+    def test_returns_none_for_non_string(self):
+        assert _parse_iso_date(["2026-01-01"]) is None
+        assert _parse_iso_date(None) is None
+
+    def test_repeated_dates_are_cached(self):
+        assert _parse_iso_date("2026-03-15") is _parse_iso_date("2026-03-15")
+
 
 # ── Test _extract_time_from_html ─────────────────────────────────
 
@@ -338,6 +367,10 @@ class TestExtractCategoryFromHtml:
         category = _extract_category_from_html(sample_detail_html)
         assert category == "expo"
 
+    def test_accepts_parsed_page(self, sample_detail_html):
+        page = HTMLParser(sample_detail_html, "https://www.lezef.org")
+        assert _extract_category_from_html(page) == "expo"
+
     def test_handles_no_category(self):
         html = "<html><body><p>No category</p></body></html>"
         category = _extract_category_from_html(html)
@@ -395,6 +428,22 @@ class TestExtractDescriptionFromHtml:
         description = _extract_description_from_html(html)
         assert len(description) <= 160
 
+    def test_meta_decodes_entities(self):
+        html = (
+            '<meta name="description" '
+            'content="Th&eacute;&acirc;tre &amp; danse pour tous les publics">'
+        )
+        description = _extract_description_from_html(html)
+        assert description == "Théâtre & danse pour tous les publics"
+
+    def test_meta_with_content_before_name(self):
+        html = (
+            '<meta content="A great event with amazing performances." '
+            'name="description">'
+        )
+        description = _extract_description_from_html(html)
+        assert "great event" in description
+
 
 # ── Test _extract_performer_from_html ────────────────────────────
 
@@ -438,6 +487,21 @@ class TestExtractPerformerFromHtml:
         performers = _extract_performer_from_html(html)
         assert len(performers) <= 5
 
+    def test_keeps_first_five_unique(self):
+        html = """
+        <html><body>
+            <p class="artiste">Artist 1</p>
+            <p class="artiste">ARTIST 1</p>
+            <p class="artiste">Artist 2</p>
+            <p class="artiste">Artist 3</p>
+            <p class="compagnie">Artist 4</p>
+            <p class="compagnie">Artist 5</p>
+            <p class="compagnie">Artist 6</p>
+        </body></html>
+        """
+        performers = _extract_performer_from_html(html)
+        assert performers == [f"artist {i}" for i in range(1, 6)]
+
 
 # ── Test _generate_source_id ──────────────────────────────────────
 
@@ -457,6 +521,12 @@ class TestGenerateSourceId:
         )
         assert sid == "lezef:opening-festival-964"
 
+    def test_ignores_query_string(self):
+        sid = _generate_source_id(
+            "https://www.lezef.org/fr/saison/25-26/l-oeil-noir-898?utm_source=x"
+        )
+        assert sid == "lezef:l-oeil-noir-898"
+
 
 # ── Test LeZefParser integration ─────────────────────────────────
 
@@ -487,62 +557,55 @@ class TestLeZefParserIntegration:
             markdown_generator=markdown_generator,
         )
 
+    @pytest.fixture
+    def mock_post(self, parser):
+        """The AJAX POST goes through the shared HTTP client."""
+        return parser.http_client.post
+
     def test_source_name(self, parser):
         # source_name is overridden by config name
         assert "Le Zef" in parser.source_name
 
-    def test_fetch_ajax_events(self, parser, sample_ajax_html):
+    def test_fetch_ajax_events(self, parser, mock_post, sample_ajax_html):
         """Test AJAX endpoint is called correctly."""
-        with patch("requests.post") as mock_post:
-            mock_response = MagicMock()
-            mock_response.text = sample_ajax_html
-            mock_response.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response
+        mock_post.return_value.text = sample_ajax_html
 
-            result = parser._fetch_ajax_events()
+        result = parser._fetch_ajax_events()
 
-            assert result == sample_ajax_html
-            mock_post.assert_called_once()
-            call_args = mock_post.call_args
-            assert "saison_ajax" in call_args.args[0]
-            assert call_args.kwargs["data"]["saisonAddr"] == "25-26"
+        assert result == sample_ajax_html
+        mock_post.assert_called_once()
+        call_args = mock_post.call_args
+        assert "saison_ajax" in call_args.args[0]
+        assert call_args.kwargs["data"]["saisonAddr"] == "25-26"
 
     def test_parse_events_with_detail_pages(
-        self, parser, sample_ajax_html, sample_detail_with_time
+        self, parser, mock_post, sample_ajax_html, sample_detail_with_time
     ):
         """Test full parsing flow with mocked HTTP."""
-        with patch("requests.post") as mock_post:
-            # Mock AJAX response
-            mock_ajax_response = MagicMock()
-            mock_ajax_response.text = sample_ajax_html
-            mock_ajax_response.raise_for_status = MagicMock()
-            mock_post.return_value = mock_ajax_response
-
-            # Mock detail page fetches
-            parser.http_client.get_text.return_value = sample_detail_with_time
-
-            html_parser = HTMLParser(
-                "<html></html>", "https://www.lezef.org/fr/saison/25-26"
-            )
-            events = parser.parse_events(html_parser)
-
-            # We have 2 event URLs from AJAX, both should be parsed
-            assert len(events) > 0
-            assert all(isinstance(e, Event) for e in events)
-
-    def test_parse_events_empty_ajax(self, parser):
+        mock_post.return_value.text = sample_ajax_html
+
+        # Mock detail page fetches
+        parser.http_client.get_text.return_value = sample_detail_with_time
+
+        # crawl() passes None since Le Zef does not use the listing page
+        events = parser.parse_events(None)
+
+        # We have 2 event URLs from AJAX, both should be parsed
+        assert len(events) > 0
+        assert all(isinstance(e, Event) for e in events)
+
+    def test_fetch_ajax_events_handles_http_error(self, parser, mock_post):
+        """HTTP failures on the AJAX endpoint are logged, not raised."""
+        mock_post.side_effect = httpx.ConnectError("connection refused")
+
+        assert parser._fetch_ajax_events() is None
+
+    def test_parse_events_empty_ajax(self, parser, mock_post):
         """Test graceful handling of empty AJAX response."""
-        with patch("requests.post") as mock_post:
-            mock_response = MagicMock()
-            mock_response.text = "<html><body></body></html>"
-            mock_response.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response
-
-            html_parser = HTMLParser(
-                "<html></html>", "https://www.lezef.org/fr/saison/25-26"
-            )
-            events = parser.parse_events(html_parser)
-            assert events == []
+        mock_post.return_value.text = "<html><body></body></html>"
+
+        events = parser.parse_events(None)
+        assert events == []
 
     def test_parse_detail_page(self, parser, sample_detail_with_time):
         """Test parsing a single detail page."""
@@ -572,7 +635,9 @@ class TestLeZefParserIntegration:
 
     def test_parse_detail_page_no_json_ld(self, parser):
         """Test handling of detail page without JSON-LD."""
-        parser.http_client.get_text.return_value = "<html><body><h1>Test</h1></body></html>"
+        parser.http_client.get_text.return_value = (
+            "<html><body><h1>Test</h1></body></html>"
+        )
 
         event = parser._parse_detail_page(
             "https://www.lezef.org/fr/saison/25-26/test-event"
@@ -611,6 +676,29 @@ class TestLeZefParserIntegration:
         assert event.start_datetime.hour == 20
         assert event.start_datetime.minute == 0
 
+    def test_map_category_ignores_case(self, parser):
+        """Single-cased config keys match any casing of the source label."""
+        assert parser.map_category("EXPO") == "art"
+        assert parser.map_category("Cirque") == "theatre"
+        assert parser.map_category("danse contemporaine") == "danse"
+
+    def test_map_category_first_key_wins(self, mock_config):
+        """The first matching key in config order wins, even over an exact key."""
+        mock_config["category_map"] = {
+            "concert": "musique",
+            "concert dessiné": "art",
+            "Cirque": "theatre",
+            "cirque": "communaute",
+        }
+        parser = LeZefParser(
+            config=mock_config,
+            http_client=MagicMock(),
+            image_downloader=MagicMock(),
+            markdown_generator=MagicMock(),
+        )
+        assert parser.map_category("Concert dessiné") == "musique"
+        assert parser.map_category("CIRQUE") == "theatre"
+
     def test_category_mapping(self, parser):
         """Test that categories are correctly mapped."""
         # Create a detail page with a future date
@@ -719,14 +807,65 @@ class TestLeZefParserIntegration:
         assert event is not None
         assert event.name == "Ongoing Exhibition"
         # The event date should be today (not the past startDate)
-        from datetime import datetime
-        from zoneinfo import ZoneInfo
-
-        today = datetime.now(ZoneInfo("Europe/Paris")).date()
+        today = datetime.now(PARIS_TZ).date()
         assert event.start_datetime.date() == today
         # Time should be 10:00 for exhibitions
         assert event.start_datetime.hour == 10
 
+    def test_ongoing_exhibition_uses_given_now(self, parser):
+        """The reference time passed in by parse_events decides the date."""
+        json_ld = json.dumps(
+            {
+                "@type": "Event",
+                "name": "Ongoing Exhibition",
+                "startDate": "2025-09-01",
+                "endDate": "2025-12-31",
+            }
+        )
+        html = f"""
+        <html>
+        <head><script type="application/ld+json">{json_ld}</script></head>
+        <body><h1>Ongoing Exhibition</h1></body>
+        </html>
+        """
+        now = datetime(2025, 10, 15, 14, 30, tzinfo=PARIS_TZ)
+
+        event = parser._parse_detail_page(
+            "https://www.lezef.org/fr/saison/25-26/ongoing-exhibition",
+            html=html,
+            now=now,
+        )
+
+        assert event is not None
+        assert event.start_datetime == datetime(2025, 10, 15, 10, 0, tzinfo=PARIS_TZ)
+
+    def test_list_enddate_is_ignored(self, parser):
+        """A non-string endDate is ignored rather than raising."""
+        json_ld = json.dumps(
+            {
+                "@type": "Event",
+                "name": "Past Event",
+                "startDate": "2025-09-01",
+                "endDate": ["2025-12-31"],
+            }
+        )
+        html = f"""
+        <html>
+        <head><script type="application/ld+json">{json_ld}</script></head>
+        <body><h1>Past Event</h1></body>
+        </html>
+        """
+        now = datetime(2025, 10, 15, 14, 30, tzinfo=PARIS_TZ)
+
+        event = parser._parse_detail_page(
+            "https://www.lezef.org/fr/saison/25-26/past-event",
+            html=html,
+            now=now,
+        )
+
+        # Without a usable endDate this is a plain past event
+        assert event is None
+
     def test_past_event_without_enddate_is_skipped(self, parser):
         """Test that past events without endDate are still skipped."""
         json_ld = json.dumps(
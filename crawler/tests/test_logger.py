@@ -1,39 +1,95 @@
 """Tests for the logging module."""
 
+import io
 import json
 import logging
+import queue
 import tempfile
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
 
 import pytest
 
+import src.logger
 from src.logger import (
     COLORS,
+    CONSOLE_FORMAT,
     DEFAULT_BACKUP_COUNT,
     DEFAULT_LOG_LEVEL,
     DEFAULT_MAX_BYTES,
+    BufferingQueueListener,
+    CachedTimeFormatter,
+    CachingLogRecord,
     ColorFormatter,
+    CountingRotatingFileHandler,
     JSONFormatter,
+    flush,
     get_logger,
     setup_logging,
+    teardown_logging,
 )
 
 
+@pytest.fixture(autouse=True)
+def _teardown_logging():
+    """Leave no handlers or process-wide record settings behind."""
+    yield
+    teardown_logging()
+
+
+def _make_record(
+    msg="Test",
+    args=(),
+    level=logging.INFO,
+    name="test",
+    exc_info=None,
+    factory=logging.LogRecord,
+):
+    """Build a log record with the defaults most formatter tests share."""
+    return factory(
+        name=name,
+        level=level,
+        pathname="",
+        lineno=0,
+        msg=msg,
+        args=args,
+        exc_info=exc_info,
+    )
+
+
+def _queue_handlers(logger):
+    return [h for h in logger.handlers if isinstance(h, QueueHandler)]
+
+
+def _file_handlers(logger):
+    """Rotating file handlers fed through the logger's queue listener."""
+    return [
+        h
+        for qh in _queue_handlers(logger)
+        for h in qh.listener.handlers
+        if isinstance(h, RotatingFileHandler)
+    ]
+
+
+def _wait_for_text(path, text, timeout=2.0):
+    """Poll a log file until the listener thread has written ``text``."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists() and text in path.read_text():
+            return True
+        time.sleep(0.01)
+    return False
+
+
 class TestColorFormatter:
     """Tests for the ColorFormatter class."""
 
     def test_format_adds_color_codes(self):
         """Test that format adds ANSI color codes to log level."""
         formatter = ColorFormatter("%(levelname)s: %(message)s")
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record("Test message")
         result = formatter.format(record)
         assert COLORS["INFO"] in result
         assert COLORS["RESET"] in result
@@ -42,19 +98,26 @@ class TestColorFormatter:
     def test_format_preserves_original_level_name(self):
         """Test that the original level name is restored after formatting."""
         formatter = ColorFormatter("%(levelname)s: %(message)s")
-        record = logging.LogRecord(
-            name="test",
-            level=logging.WARNING,
-            pathname="",
-            lineno=0,
-            msg="Warning",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record("Warning", level=logging.WARNING)
         formatter.format(record)
         # Original level name should be preserved
         assert record.levelname == "WARNING"
 
+    def test_format_restores_level_name_when_formatting_fails(self):
+        """Test that the level name is restored even if formatting raises."""
+        formatter = ColorFormatter("%(levelname)s: %(message)s")
+        record = _make_record("Needs %s %s", args=("one",), level=logging.WARNING)
+        with pytest.raises(TypeError):
+            formatter.format(record)
+        assert record.levelname == "WARNING"
+
+    def test_format_custom_level_has_no_color(self):
+        """Test that a level without a color only gets the reset code."""
+        formatter = ColorFormatter("%(levelname)s: %(message)s")
+        record = _make_record("Trace", level=5)
+        record.levelname = "TRACE"
+        assert formatter.format(record) == f"TRACE{COLORS['RESET']}: Trace"
+
     @pytest.mark.parametrize(
         "level,color",
         [
@@ -68,18 +131,73 @@ class TestColorFormatter:
     def test_format_uses_correct_color_for_level(self, level, color):
         """Test that each log level uses its correct color."""
         formatter = ColorFormatter("%(levelname)s: %(message)s")
-        record = logging.LogRecord(
-            name="test",
-            level=level,
-            pathname="",
-            lineno=0,
-            msg="Test",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record(level=level)
         result = formatter.format(record)
         assert color in result
 
+    @pytest.mark.parametrize("with_exception", [False, True])
+    def test_console_layout_matches_percent_formatting(self, with_exception):
+        """Test that the CONSOLE_FORMAT fast path renders like %-formatting."""
+        fast = ColorFormatter(CONSOLE_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
+        generic = ColorFormatter(CONSOLE_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
+        generic._console_layout = False
+        exc_info = None
+        if with_exception:
+            try:
+                raise ValueError("Test error")
+            except ValueError:
+                import sys
+
+                exc_info = sys.exc_info()
+
+        for level in (logging.INFO, logging.WARNING):
+            record = _make_record(
+                "Processing %s", args=("source1",), level=level, exc_info=exc_info
+            )
+            assert fast.format(record) == generic.format(record)
+
+    def test_other_formats_skip_console_layout(self):
+        """Test that a custom format string goes through %-formatting."""
+        formatter = ColorFormatter("%(levelname)s: %(message)s")
+        assert formatter._console_layout is False
+
+
+class TestCachedTimeFormatter:
+    """Tests for the per-second formatTime cache."""
+
+    def _record_at(self, created):
+        record = _make_record()
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+
+    @pytest.mark.parametrize("datefmt", [None, "%Y-%m-%d %H:%M:%S"])
+    def test_matches_stock_formatter(self, datefmt):
+        """Test that times render exactly as logging.Formatter renders them."""
+        cached = CachedTimeFormatter("%(asctime)s %(message)s", datefmt=datefmt)
+        stock = logging.Formatter("%(asctime)s %(message)s", datefmt=datefmt)
+
+        for created in (1_768_077_005.123, 1_768_077_005.987, 1_768_077_006.5):
+            record = self._record_at(created)
+            assert cached.format(record) == stock.format(record)
+
+    def test_reuses_time_within_second(self, monkeypatch):
+        """Test that strftime runs once for records in the same second."""
+        formatter = CachedTimeFormatter("%(asctime)s", datefmt="%H:%M:%S")
+        calls = []
+        strftime = time.strftime
+
+        def counting_strftime(fmt, t):
+            calls.append(fmt)
+            return strftime(fmt, t)
+
+        monkeypatch.setattr("src.logger.time.strftime", counting_strftime)
+        formatter.format(self._record_at(1_768_077_005.1))
+        formatter.format(self._record_at(1_768_077_005.9))
+        formatter.format(self._record_at(1_768_077_006.0))
+
+        assert len(calls) == 2
+
 
 class TestJSONFormatter:
     """Tests for the JSONFormatter class."""
@@ -87,15 +205,7 @@ class TestJSONFormatter:
     def test_format_returns_valid_json(self):
         """Test that format returns valid JSON."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test.module",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record("Test message", name="test.module")
         result = formatter.format(record)
         data = json.loads(result)  # Should not raise
         assert isinstance(data, dict)
@@ -103,15 +213,7 @@ class TestJSONFormatter:
     def test_format_includes_required_fields(self):
         """Test that format includes all required fields."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test.module",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record("Test message", name="test.module")
         result = formatter.format(record)
         data = json.loads(result)
 
@@ -127,15 +229,7 @@ class TestJSONFormatter:
     def test_format_timestamp_is_iso_format(self):
         """Test that timestamp is in ISO format with Z suffix."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record()
         result = formatter.format(record)
         data = json.loads(result)
         assert data["timestamp"].endswith("Z")
@@ -154,37 +248,155 @@ class TestJSONFormatter:
 
             exc_info = sys.exc_info()
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.ERROR,
-            pathname="",
-            lineno=0,
-            msg="Error occurred",
-            args=(),
-            exc_info=exc_info,
-        )
+        record = _make_record("Error occurred", level=logging.ERROR, exc_info=exc_info)
         result = formatter.format(record)
         data = json.loads(result)
         assert "exception" in data
         assert "ValueError" in data["exception"]
         assert "Test error" in data["exception"]
 
+    def test_format_reuses_cached_exception_text(self, monkeypatch):
+        """Test that a traceback rendered by an earlier formatter is reused."""
+        try:
+            raise ValueError("Test error")
+        except ValueError:
+            import sys
+
+            exc_info = sys.exc_info()
+        record = _make_record("Error occurred", level=logging.ERROR, exc_info=exc_info)
+        ColorFormatter("%(message)s").format(record)  # console formats first
+
+        def fail(self, ei):
+            raise AssertionError("traceback formatted twice")
+
+        monkeypatch.setattr(JSONFormatter, "formatException", fail)
+        data = json.loads(JSONFormatter().format(record))
+
+        assert data["exception"] == record.exc_text
+        assert "Test error" in data["exception"]
+
     def test_format_handles_message_args(self):
         """Test that message arguments are properly formatted."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Processing %s with %d events",
-            args=("source1", 5),
-            exc_info=None,
-        )
+        record = _make_record("Processing %s with %d events", args=("source1", 5))
         result = formatter.format(record)
         data = json.loads(result)
         assert data["message"] == "Processing source1 with 5 events"
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_format_encodes_extras_with_either_backend(self, monkeypatch, use_orjson):
+        """Test that orjson and the stdlib fallback produce the same data."""
+        if not use_orjson:
+            monkeypatch.setattr("src.logger.orjson", None)
+        elif src.logger.orjson is None:
+            pytest.skip("orjson not installed")
+        formatter = JSONFormatter()
+        record = _make_record("Événement %s", args=("créé",))
+        record.when = datetime(2026, 1, 10, 20, 30, tzinfo=UTC)
+        record.counts = {1: 2}
+        record.big = 2**70
+
+        data = json.loads(formatter.format(record))
+
+        assert data["message"] == "Événement créé"
+        assert data["timestamp"].endswith("Z")
+        assert data["extra"]["when"] == "2026-01-10T20:30:00Z"
+        assert data["extra"]["counts"] == {"1": 2}
+        assert data["extra"]["big"] == 2**70
+
+    def test_format_template_escapes_like_json_dumps(self):
+        """Test that the fixed-schema path matches json.dumps output."""
+        formatter = JSONFormatter()
+        try:
+            raise ValueError('bad "quote"\n')
+        except ValueError:
+            import sys
+
+            exc_info = sys.exc_info()
+        record = _make_record(
+            'Tab\there, quote " and backslash \\ in %s',
+            args=("Café\x00",),
+            level=logging.ERROR,
+            name="src.parsers.l'œuvre",
+            exc_info=exc_info,
+        )
+
+        result = formatter.format(record)
+
+        data = json.loads(result)
+        assert result == json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        assert data["message"] == 'Tab\there, quote " and backslash \\ in Café\x00'
+        assert data["logger"] == "src.parsers.l'œuvre"
+        assert 'ValueError: bad "quote"' in data["exception"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_template_and_encoders_share_byte_format(self, monkeypatch, use_orjson):
+        """Test that the template and either encoder write identical bytes."""
+        if not use_orjson:
+            monkeypatch.setattr("src.logger.orjson", None)
+        elif src.logger.orjson is None:
+            pytest.skip("orjson not installed")
+        record = _make_record("Événement « %s »", args=("créé",), name="src.œuvre")
+
+        templated = JSONFormatter().format(record)
+
+        assert templated == src.logger._dumps_json(json.loads(templated))
+        assert '"message":"Événement « créé »"' in templated
+
+    def test_format_ignores_attributes_set_by_formatters(self):
+        """Test that asctime from the console formatter is not an extra."""
+        record = _make_record()
+        ColorFormatter(CONSOLE_FORMAT).format(record)  # sets record.asctime
+
+        data = json.loads(JSONFormatter().format(record))
+
+        assert "extra" not in data
+
+    def test_format_timestamp_uses_record_creation_time(self):
+        """Test that the timestamp is when the record was logged, to the ms."""
+        formatter = JSONFormatter()
+        record = _make_record()
+        record.created = datetime(2026, 1, 10, 20, 30, 5, 123456, UTC).timestamp()
+
+        data = json.loads(formatter.format(record))
+
+        assert data["timestamp"] == "2026-01-10T20:30:05.123Z"
+
+    def test_format_timestamp_cached_within_millisecond(self, monkeypatch):
+        """Test that records in the same millisecond reuse the rendered time."""
+        formatter = JSONFormatter()
+        record = _make_record()
+        record.created = 1_768_077_005.1231
+        first = json.loads(formatter.format(record))["timestamp"]
+
+        monkeypatch.setattr("src.logger.datetime", None)  # must not be needed
+        record.created = 1_768_077_005.1238
+        second = json.loads(formatter.format(record))["timestamp"]
+
+        assert second == first
+
+
+FILE_LOGGING_MAX_BYTES = 5 * 1024 * 1024  # 5MB
+FILE_LOGGING_BACKUP_COUNT = 3
+
+
+@pytest.fixture(scope="module")
+def file_logging(tmp_path_factory):
+    """One text file setup shared by the tests that only inspect its handlers.
+
+    Returns the nested log directory setup_logging had to create and the file
+    handlers it attached; later setup_logging calls leave both intact.
+    """
+    log_dir = tmp_path_factory.mktemp("logs") / "nested"
+    logger = setup_logging(
+        log_file="test.log",
+        log_dir=log_dir,
+        log_format="text",
+        max_bytes=FILE_LOGGING_MAX_BYTES,
+        backup_count=FILE_LOGGING_BACKUP_COUNT,
+    )
+    return log_dir, _file_handlers(logger)
+
 
 class TestSetupLogging:
     """Tests for the setup_logging function."""
@@ -228,29 +440,20 @@ class TestSetupLogging:
         ]
         assert len(stream_handlers) == 1
 
-    def test_setup_logging_with_file(self):
+    def test_setup_logging_with_file(self, file_logging):
         """Test that a file handler is created when log_file is specified."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_path = Path(tmpdir)
-            logger = setup_logging(log_file="test.log", log_dir=log_path)
-
-            # Should have both console and file handlers
-            from logging.handlers import RotatingFileHandler
+        log_dir, file_handlers = file_logging
 
-            file_handlers = [
-                h for h in logger.handlers if isinstance(h, RotatingFileHandler)
-            ]
-            assert len(file_handlers) == 1
+        # Should have both console and file handlers
+        assert len(file_handlers) == 1
 
-            # Log file should be created
-            assert (log_path / "test.log").exists()
+        # Log file should be created
+        assert (log_dir / "test.log").exists()
 
-    def test_setup_logging_creates_log_directory(self):
+    def test_setup_logging_creates_log_directory(self, file_logging):
         """Test that log directory is created if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir) / "logs" / "nested"
-            setup_logging(log_file="test.log", log_dir=log_dir)
-            assert log_dir.exists()
+        log_dir, _ = file_logging
+        assert log_dir.exists()
 
     def test_setup_logging_with_json_format(self):
         """Test that JSON formatter is used when log_format is 'json'."""
@@ -260,53 +463,54 @@ class TestSetupLogging:
                 log_file="test.log", log_dir=log_path, log_format="json"
             )
 
-            from logging.handlers import RotatingFileHandler
-
-            file_handlers = [
-                h for h in logger.handlers if isinstance(h, RotatingFileHandler)
-            ]
+            file_handlers = _file_handlers(logger)
             assert len(file_handlers) == 1
             assert isinstance(file_handlers[0].formatter, JSONFormatter)
 
-    def test_setup_logging_with_text_format(self):
+    def test_setup_logging_with_text_format(self, file_logging):
         """Test that standard formatter is used when log_format is 'text'."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_path = Path(tmpdir)
-            logger = setup_logging(
-                log_file="test.log", log_dir=log_path, log_format="text"
-            )
+        _, file_handlers = file_logging
 
-            from logging.handlers import RotatingFileHandler
+        assert isinstance(file_handlers[0].formatter, logging.Formatter)
+        assert not isinstance(file_handlers[0].formatter, JSONFormatter)
 
-            file_handlers = [
-                h for h in logger.handlers if isinstance(h, RotatingFileHandler)
-            ]
-            assert len(file_handlers) == 1
-            assert isinstance(file_handlers[0].formatter, logging.Formatter)
-            assert not isinstance(file_handlers[0].formatter, JSONFormatter)
-
-    def test_setup_logging_rotating_handler_config(self):
+    def test_setup_logging_rotating_handler_config(self, file_logging):
         """Test that rotating handler is configured with correct parameters."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_path = Path(tmpdir)
-            max_bytes = 5 * 1024 * 1024  # 5MB
-            backup_count = 3
+        _, file_handlers = file_logging
 
-            logger = setup_logging(
-                log_file="test.log",
-                log_dir=log_path,
-                max_bytes=max_bytes,
-                backup_count=backup_count,
-            )
+        handler = file_handlers[0]
+        assert handler.maxBytes == FILE_LOGGING_MAX_BYTES
+        assert handler.backupCount == FILE_LOGGING_BACKUP_COUNT
+
+    def test_setup_logging_skips_thread_and_process_info(self, monkeypatch):
+        """Test that records no longer collect thread and process details."""
+        for flag in ("logThreads", "logProcesses", "logMultiprocessing"):
+            monkeypatch.setattr(logging, flag, True)
+        setup_logging()
 
-            from logging.handlers import RotatingFileHandler
+        record = _make_record()
 
-            file_handlers = [
-                h for h in logger.handlers if isinstance(h, RotatingFileHandler)
-            ]
-            handler = file_handlers[0]
-            assert handler.maxBytes == max_bytes
-            assert handler.backupCount == backup_count
+        assert record.thread is None
+        assert record.threadName is None
+        assert record.process is None
+        assert record.processName is None
+
+    def test_teardown_restores_record_settings(self, monkeypatch):
+        """Test that teardown_logging undoes the process-wide changes."""
+        monkeypatch.setattr(logging, "logThreads", True)
+        monkeypatch.setattr(logging, "logProcesses", True)
+        monkeypatch.setattr(logging, "logMultiprocessing", True)
+        logging.setLogRecordFactory(logging.LogRecord)
+        logger = setup_logging(stream=io.StringIO())
+
+        teardown_logging()
+
+        assert logging.logThreads is True
+        assert logging.logProcesses is True
+        assert logging.logMultiprocessing is True
+        assert logging.getLogRecordFactory() is logging.LogRecord
+        assert logger.handlers == []
+        assert _make_record().thread is not None
 
     def test_default_values(self):
         """Test that default values are correct."""
@@ -315,6 +519,190 @@ class TestSetupLogging:
         assert DEFAULT_BACKUP_COUNT == 5
 
 
+class TestCachingLogRecord:
+    """Tests for the CachingLogRecord message cache."""
+
+    def _make_record(self, args=("source1",)):
+        return _make_record("Processing %s", args=args, factory=CachingLogRecord)
+
+    def test_formats_arguments_once(self):
+        """Test that repeated getMessage calls reuse the first result."""
+        calls = []
+
+        class Arg:
+            def __str__(self):
+                calls.append(1)
+                return "arg"
+
+        record = self._make_record(args=(Arg(),))
+
+        assert record.getMessage() == "Processing arg"
+        assert record.getMessage() == "Processing arg"
+        assert len(calls) == 1
+
+    def test_recomputes_when_args_change(self):
+        """Test that replacing msg or args invalidates the cache."""
+        record = self._make_record()
+        assert record.getMessage() == "Processing source1"
+
+        record.args = ("source2",)
+        assert record.getMessage() == "Processing source2"
+        record.msg = "Done %s"
+        assert record.getMessage() == "Done source2"
+
+    def test_cache_not_in_json_extras(self):
+        """Test that the cache attribute is not reported as an extra field."""
+        record = self._make_record()
+        record.getMessage()
+
+        data = json.loads(JSONFormatter().format(record))
+
+        assert "extra" not in data
+
+    @pytest.fixture
+    def restore_factory(self):
+        original = logging.getLogRecordFactory()
+        yield
+        logging.setLogRecordFactory(original)
+
+    def test_setup_logging_installs_record_factory(self, restore_factory):
+        """Test that setup_logging swaps in the caching record factory."""
+        logging.setLogRecordFactory(logging.LogRecord)
+        setup_logging()
+
+        assert logging.getLogRecordFactory() is CachingLogRecord
+
+    def test_setup_logging_keeps_custom_record_factory(self, restore_factory):
+        """Test that a factory installed by someone else is left alone."""
+
+        def factory(*args, **kwargs):
+            return logging.LogRecord(*args, **kwargs)
+
+        logging.setLogRecordFactory(factory)
+        setup_logging()
+
+        assert logging.getLogRecordFactory() is factory
+
+
+class TestCountingRotatingFileHandler:
+    """Tests for the size-counting rotating file handler."""
+
+    def test_rolls_over_when_size_exceeded(self, tmp_path):
+        """Test that the file rotates once the counted size reaches maxBytes."""
+        log_file = tmp_path / "test.log"
+        handler = CountingRotatingFileHandler(
+            log_file, maxBytes=25, backupCount=1, encoding="utf-8"
+        )
+        try:
+            handler.emit(_make_record("first line"))
+            handler.emit(_make_record("second line"))
+            handler.emit(_make_record("third line"))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "test.log.1").read_text() == "first line\nsecond line\n"
+        assert log_file.read_text() == "third line\n"
+
+    def test_counts_existing_file_size(self, tmp_path):
+        """Test that the counter starts from the size of an existing file."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("x" * 20 + "\n")
+        handler = CountingRotatingFileHandler(
+            log_file, maxBytes=25, backupCount=1, encoding="utf-8"
+        )
+        try:
+            handler.emit(_make_record("new line"))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "test.log.1").exists()
+        assert log_file.read_text() == "new line\n"
+
+    def test_buffer_size_defers_writes_until_flush(self, tmp_path):
+        """Test that a buffered handler writes only when flushed."""
+        log_file = tmp_path / "test.log"
+        handler = CountingRotatingFileHandler(
+            log_file, maxBytes=1024, backupCount=1, encoding="utf-8", buffer_size=4096
+        )
+        try:
+            handler.emit(_make_record("buffered"))
+            assert log_file.read_text() == ""
+
+            handler.flush()
+            assert log_file.read_text() == "buffered\n"
+        finally:
+            handler.close()
+
+    def test_buffered_handler_flushes_errors(self, tmp_path):
+        """Test that an ERROR record pushes itself and earlier records out."""
+        log_file = tmp_path / "test.log"
+        handler = CountingRotatingFileHandler(
+            log_file, maxBytes=1024, backupCount=1, encoding="utf-8", buffer_size=4096
+        )
+        try:
+            handler.emit(_make_record("one"))
+            assert log_file.read_text() == ""
+
+            handler.emit(_make_record("two", level=logging.ERROR))
+            assert log_file.read_text() == "one\ntwo\n"
+        finally:
+            handler.close()
+
+    def test_does_not_stat_on_emit(self, tmp_path, monkeypatch):
+        """Test that emitting does not check the file on disk."""
+        handler = CountingRotatingFileHandler(
+            tmp_path / "test.log", maxBytes=1024, backupCount=1, encoding="utf-8"
+        )
+        calls = []
+        monkeypatch.setattr("os.path.isfile", lambda path: calls.append(path))
+        monkeypatch.setattr("os.path.exists", lambda path: calls.append(path))
+        try:
+            handler.emit(_make_record("line"))
+        finally:
+            handler.close()
+
+        assert calls == []
+
+
+class TestBufferingQueueListener:
+    """Tests for BufferingQueueListener."""
+
+    def test_flush_error_keeps_listener_running(self):
+        """Test that a handler whose flush fails does not stop the thread."""
+
+        class FailingFlushHandler(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.messages = []
+                self.errors = []
+
+            def emit(self, record):
+                self.messages.append(record.getMessage())
+
+            def flush(self):
+                raise OSError("disk full")
+
+            def handleError(self, record):
+                self.errors.append(record)
+
+        handler = FailingFlushHandler()
+        log_queue = queue.SimpleQueue()
+        listener = BufferingQueueListener(log_queue, handler, flush_interval=0.01)
+        listener.start()
+        try:
+            time.sleep(0.05)
+            log_queue.put(_make_record("after failed flush"))
+            deadline = time.monotonic() + 2
+            while not handler.messages and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert listener._thread.is_alive()
+            assert handler.messages == ["after failed flush"]
+            assert handler.errors
+        finally:
+            listener.stop()
+
+
 class TestGetLogger:
     """Tests for the get_logger function."""
 
@@ -348,9 +736,7 @@ class TestLoggingIntegration:
 
             logger.info("Test message for file")
 
-            # Flush handlers
-            for handler in logging.getLogger("src").handlers:
-                handler.flush()
+            flush()
 
             log_file = log_path / "test.log"
             content = log_file.read_text()
@@ -359,53 +745,158 @@ class TestLoggingIntegration:
 
     def test_json_log_file_contains_valid_json_lines(self):
         """Test that JSON format produces valid JSON lines."""
+        buf = io.StringIO()
+        setup_logging(level="INFO", log_format="json", stream=buf)
+        logger = get_logger("src.json_test")
+
+        logger.info("First message")
+        logger.warning("Second message")
+
+        lines = buf.getvalue().strip().split("\n")
+
+        # Each line should be valid JSON
+        assert len(lines) == 2
+        for line in lines:
+            data = json.loads(line)
+            assert "timestamp" in data
+            assert "level" in data
+            assert "message" in data
+
+    def test_log_levels_filter_correctly(self):
+        """Test that log level filtering works correctly."""
+        buf = io.StringIO()
+        setup_logging(level="WARNING", stream=buf)
+        logger = get_logger("src.filter_test")
+
+        logger.debug("Debug message")
+        logger.info("Info message")
+        logger.warning("Warning message")
+        logger.error("Error message")
+
+        content = buf.getvalue()
+
+        # Debug and Info should not appear (below WARNING level)
+        assert "Debug message" not in content
+        assert "Info message" not in content
+        # Warning and Error should appear
+        assert "Warning message" in content
+        assert "Error message" in content
+
+    def test_stream_replaces_log_file(self):
+        """Test that a stream takes precedence over log_file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir)
+            buf = io.StringIO()
+            logger = setup_logging(log_file="test.log", log_dir=log_path, stream=buf)
+
+            get_logger("src.stream_test").info("Stream message")
+
+            assert _file_handlers(logger) == []
+            assert not (log_path / "test.log").exists()
+            assert "| INFO     | src.stream_test" in buf.getvalue()
+
+    def test_json_log_file_keeps_exception_and_extras(self):
+        """Test that queued records keep exc_info, args and extra fields."""
         with tempfile.TemporaryDirectory() as tmpdir:
             log_path = Path(tmpdir)
             setup_logging(
                 level="INFO", log_file="test.log", log_dir=log_path, log_format="json"
             )
-            logger = get_logger("src.json_test")
+            logger = get_logger("src.queue_test")
 
-            logger.info("First message")
-            logger.warning("Second message")
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("Failed %s", "fetch", extra={"url": "https://x"})
 
-            # Flush handlers
-            for handler in logging.getLogger("src").handlers:
-                handler.flush()
+            flush()
 
-            log_file = log_path / "test.log"
-            lines = log_file.read_text().strip().split("\n")
+            data = json.loads((log_path / "test.log").read_text())
+            assert data["message"] == "Failed fetch"
+            assert data["extra"]["url"] == "https://x"
+            assert "ValueError: boom" in data["exception"]
 
-            # Each line should be valid JSON
-            for line in lines:
-                if line:
-                    data = json.loads(line)
-                    assert "timestamp" in data
-                    assert "level" in data
-                    assert "message" in data
+    def test_json_log_file_from_configured_pipeline(self):
+        """Test JSON lines written through the console and queue handlers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir)
+            setup_logging(
+                level="INFO", log_file="test.log", log_dir=log_path, log_format="json"
+            )
+            logger = get_logger("src.pipeline_test")
+
+            logger.info("Créé %s", "ici")
+            logger.info("With extra", extra={"source": "lezef"})
+            flush()
+
+            lines = (log_path / "test.log").read_text(encoding="utf-8").splitlines()
+            plain, extra = (json.loads(line) for line in lines)
+            assert plain["message"] == "Créé ici"
+            assert "extra" not in plain
+            assert extra["extra"] == {"source": "lezef"}
+            assert lines[0] == json.dumps(
+                plain, separators=(",", ":"), ensure_ascii=False
+            )
 
-    def test_log_levels_filter_correctly(self):
-        """Test that log level filtering works correctly."""
+    def test_buffered_records_wait_for_flush(self):
+        """Test that INFO records stay buffered until the listener drains."""
         with tempfile.TemporaryDirectory() as tmpdir:
             log_path = Path(tmpdir)
-            setup_logging(level="WARNING", log_file="test.log", log_dir=log_path)
-            logger = get_logger("src.filter_test")
+            setup_logging(
+                level="INFO", log_file="test.log", log_dir=log_path, flush_interval=60
+            )
+            logger = get_logger("src.buffer_test")
+
+            logger.info("Buffered message")
+
+            assert not _wait_for_text(log_path / "test.log", "Buffered", 0.1)
+            flush()
+            assert "Buffered message" in (log_path / "test.log").read_text()
 
-            logger.debug("Debug message")
-            logger.info("Info message")
-            logger.warning("Warning message")
+    def test_error_flushes_buffer_immediately(self):
+        """Test that an ERROR record writes itself and the buffer before it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir)
+            setup_logging(
+                level="INFO", log_file="test.log", log_dir=log_path, flush_interval=60
+            )
+            logger = get_logger("src.buffer_test")
+
+            logger.info("Before error")
             logger.error("Error message")
 
-            # Flush handlers
-            for handler in logging.getLogger("src").handlers:
-                handler.flush()
+            assert _wait_for_text(log_path / "test.log", "Error message")
+            assert "Before error" in (log_path / "test.log").read_text()
 
-            log_file = log_path / "test.log"
-            content = log_file.read_text()
+    def test_flush_interval_writes_idle_buffer(self):
+        """Test that buffered records are written once the interval elapses."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir)
+            setup_logging(
+                level="INFO",
+                log_file="test.log",
+                log_dir=log_path,
+                flush_interval=0.05,
+            )
+            logger = get_logger("src.buffer_test")
+
+            logger.info("Idle message")
+
+            assert _wait_for_text(log_path / "test.log", "Idle message")
+
+    def test_flush_keeps_logging_to_file(self):
+        """Test that flush writes pending records and logging continues."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir)
+            setup_logging(
+                level="INFO", log_file="test.log", log_dir=log_path, flush_interval=60
+            )
+            logger = get_logger("src.flush_test")
+
+            logger.info("Before flush")
+            flush()
+            assert "Before flush" in (log_path / "test.log").read_text()
 
-            # Debug and Info should not appear (below WARNING level)
-            assert "Debug message" not in content
-            assert "Info message" not in content
-            # Warning and Error should appear
-            assert "Warning message" in content
-            assert "Error message" in content
+            logger.info("After flush")
+            flush()
+            assert "After flush" in (log_path / "test.log").read_text()
@@ -3,13 +3,19 @@
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from zoneinfo import ZoneInfo
 
 import pytest
 import yaml
 
-from src.generators.markdown import GenerateResult, GeneratorStats, MarkdownGenerator
+from src.generators.markdown import (
+    GenerateResult,
+    GeneratorStats,
+    MarkdownGenerator,
+    _emit_front_matter,
+    read_front_matter_fields,
+)
 from src.models.event import Event
 
 
@@ -174,6 +180,25 @@ class TestMarkdownGenerator:
         assert "already exists" in result.reason
         assert generator.stats.skipped_exists == 1
 
+    def test_check_exists_written_file_without_stat(self, generator, sample_event):
+        """Test that check_exists answers for written files from memory."""
+        generator.generate(sample_event)
+
+        with patch.object(Path, "exists") as exists:
+            assert generator.check_exists(sample_event)
+
+        exists.assert_not_called()
+
+    def test_skip_written_file_without_stat(self, generator, sample_event):
+        """Test that a file written by this generator is skipped without a stat."""
+        generator.generate(sample_event)
+
+        with patch.object(Path, "exists") as exists:
+            result = generator.generate(sample_event)
+
+        exists.assert_not_called()
+        assert result.action == "skipped"
+
     def test_overwrite_when_skip_existing_false(self, temp_dir, sample_event):
         """Test that files are overwritten when skip_existing=False."""
         generator = MarkdownGenerator(
@@ -216,6 +241,34 @@ class TestMarkdownGenerator:
         matches = generator.find_by_source_id("lafriche:concert-jazz")
         assert len(matches) == 1
 
+    def test_find_by_source_id_is_exact(self, generator, sample_event):
+        """Test that a source ID does not match a longer one it prefixes."""
+        generator.generate(sample_event)
+
+        assert generator.find_by_source_id("lafriche:concert") == []
+
+    def test_find_by_source_id_scans_once(self, generator, sample_event, temp_dir):
+        """Test that lookups reuse the index instead of rescanning files."""
+        generator.generate(sample_event)
+        generator.find_by_source_id("lafriche:concert-jazz")
+
+        with patch.object(Path, "rglob") as rglob:
+            matches = generator.find_by_source_id("lafriche:concert-jazz")
+
+        rglob.assert_not_called()
+        assert len(matches) == 1
+
+    def test_refresh_index_sees_files_from_other_writers(
+        self, generator, sample_event, temp_dir
+    ):
+        """Test that refresh_index picks up files written elsewhere."""
+        assert generator.find_by_source_id("lafriche:concert-jazz") == []
+
+        MarkdownGenerator(output_dir=temp_dir).generate(sample_event)
+        generator.refresh_index()
+
+        assert len(generator.find_by_source_id("lafriche:concert-jazz")) == 1
+
     def test_creates_parent_directories(self, temp_dir, sample_event):
         """Test that parent directories are created automatically."""
         deep_dir = temp_dir / "deep" / "nested" / "path"
@@ -226,6 +279,28 @@ class TestMarkdownGenerator:
         assert result.file_path.exists()
         assert "deep/nested/path" in str(result.file_path)
 
+    def test_write_leaves_no_temporary_file(self, generator, sample_event):
+        """Test that the file is written whole, without a leftover .tmp."""
+        result = generator.generate(sample_event)
+
+        assert list(result.file_path.parent.iterdir()) == [result.file_path]
+
+    def test_failed_write_removes_temporary_file(
+        self, generator, sample_event, monkeypatch
+    ):
+        """Test that a failed replace leaves neither target nor .tmp behind."""
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("src.generators.markdown.os.replace", fail_replace)
+
+        result = generator.generate(sample_event)
+
+        assert result.success is False
+        assert result.reason == "disk full"
+        assert list(result.file_path.parent.iterdir()) == []
+
     def test_stats_tracking(self, generator, sample_event):
         """Test statistics tracking."""
         assert generator.stats.created == 0
@@ -313,6 +388,28 @@ class TestMarkdownGeneratorBatch:
         assert generator.stats.created == 2
         assert generator.stats.skipped_exists == 1
 
+    def test_parallel_batch_keeps_order(self, temp_dir, sample_events):
+        """Test that a threaded batch returns results in input order."""
+        generator = MarkdownGenerator(output_dir=temp_dir, parallel=4)
+
+        results = generator.generate_batch(sample_events)
+
+        assert [r.file_path for r in results] == [
+            temp_dir / event.file_path for event in sample_events
+        ]
+        assert all(r.file_path.exists() for r in results)
+        assert generator.stats.created == 3
+
+    def test_parallel_batch_same_path_in_order(self, temp_dir, sample_events):
+        """Test that events sharing a path are handled one after another."""
+        generator = MarkdownGenerator(output_dir=temp_dir, parallel=4)
+
+        results = generator.generate_batch([sample_events[0]] * 3)
+
+        assert [r.action for r in results] == ["created", "skipped", "skipped"]
+        assert generator.stats.created == 1
+        assert generator.stats.skipped_exists == 2
+
 
 class TestMarkdownGeneratorMultiDay:
     """Tests for multi-day event generation."""
@@ -378,6 +475,50 @@ class TestMarkdownGeneratorMultiDay:
             content = result.file_path.read_text()
             assert "eventGroupId: test-group" in content
 
+    def test_multi_day_matches_single_generation(self, generator, base_event):
+        """Test that reused front matter entries match a plain generate."""
+        dates = [
+            datetime(2026, 2, 6, tzinfo=ZoneInfo("Europe/Paris")),
+            datetime(2026, 2, 7, tzinfo=ZoneInfo("Europe/Paris")),
+        ]
+        results = generator.generate_multi_day(base_event, dates, group_id="fest")
+
+        day_event = Event(
+            name=base_event.name,
+            event_url=base_event.event_url,
+            start_datetime=base_event.start_datetime.replace(day=7),
+            description=base_event.description,
+            categories=base_event.categories,
+            locations=base_event.locations,
+            event_group_id="fest",
+            day_of="Jour 2 sur 2",
+            source_id="festival:2026:day2",
+        )
+        expected = generator._build_content(
+            day_event.to_front_matter(), day_event.description
+        )
+
+        def strip_crawled(text):
+            return [line for line in text.splitlines() if "lastCrawled" not in line]
+
+        assert strip_crawled(results[1].file_path.read_text()) == strip_crawled(
+            expected
+        )
+
+    def test_parallel_multi_day_keeps_order(self, temp_dir, base_event):
+        """Test that threaded multi-day generation returns days in order."""
+        generator = MarkdownGenerator(output_dir=temp_dir, parallel=4)
+        dates = [
+            datetime(2026, 2, day, tzinfo=ZoneInfo("Europe/Paris")) for day in (8, 6, 7)
+        ]
+
+        results = generator.generate_multi_day(base_event, dates)
+
+        assert [r.action for r in results] == ["created"] * 3
+        for i, result in enumerate(results, start=1):
+            assert f"2026/02/0{5 + i}" in str(result.file_path)
+            assert f"Jour {i} sur 3" in result.file_path.read_text()
+
     def test_multi_day_files_have_day_of(self, generator, base_event, temp_dir):
         """Test that multi-day files have dayOf field."""
         dates = [
@@ -576,3 +717,118 @@ class TestMarkdownGeneratorFrenchDates:
         result2 = generator.generate(event2)
         content2 = result2.file_path.read_text()
         assert "samedi-31-janvier" in content2
+
+
+class TestEmitFrontMatter:
+    """Tests for the direct front matter writer."""
+
+    def _yaml_dump(self, front_matter):
+        return yaml.dump(
+            front_matter,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+            width=1000,
+        )
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "Concert de Jazz",
+            "Théâtre d'à côté",
+            "https://lafriche.org/concert-jazz?x=1#top",
+            "lafriche:concert-jazz",
+            "2026-01-26T20:00:00+01:00",
+            "20:00",
+            "yes",
+            "123",
+            "",
+            " leading space",
+            "Titre: sous-titre",
+            "C'est # pas un commentaire",
+            "- tiret",
+            "[crochets]",
+            "ligne 1\nligne 2",
+            "tab\there",
+            "\ufeffbom",
+            "mot " * 300,
+            True,
+            False,
+            None,
+            42,
+            1.5,
+            [],
+            ["musique", "20:00", "Jazz: live", "yes"],
+            [1, "deux"],
+        ],
+        ids=repr,
+    )
+    def test_matches_yaml_dump(self, value):
+        """Test that each kind of value is written exactly as yaml.dump would."""
+        front_matter = {"title": "Titre", "field": value, "expired": False}
+
+        assert _emit_front_matter(front_matter) == self._yaml_dump(front_matter)
+
+    def test_event_front_matter_matches_yaml_dump(self):
+        """Test a full event's front matter against yaml.dump."""
+        event = Event(
+            name="Concert de Jazz à l'Espace Julien",
+            event_url="https://example.com/concert",
+            start_datetime=datetime(
+                2026, 1, 26, 20, 0, tzinfo=ZoneInfo("Europe/Paris")
+            ),
+            description="Une soirée : jazz & blues\n\nEntrée libre.",
+            image="/images/concert.jpg",
+            categories=["musique"],
+            locations=["espace-julien"],
+            tags=["jazz", "blues"],
+            event_group_id="concert-202601",
+            day_of="Jour 1 sur 2",
+            source_id="espacejulien:123",
+        )
+        front_matter = event.to_front_matter()
+
+        assert _emit_front_matter(front_matter) == self._yaml_dump(front_matter)
+
+
+class TestReadFrontMatterFields:
+    """Tests for reading selected front matter fields."""
+
+    def _write(self, tmp_path, text):
+        path = tmp_path / "event.fr.md"
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_reads_requested_keys_only(self, tmp_path):
+        path = self._write(
+            tmp_path,
+            "---\n"
+            "name: Concert\n"
+            "date: 2026-01-26T20:00:00+01:00\n"
+            "locations:\n"
+            "- la-friche\n"
+            "- le-dome\n"
+            "sourceId: '123'\n"
+            "---\n"
+            "sourceId: body\n",
+        )
+
+        fields = read_front_matter_fields(path, ("locations", "sourceId"))
+
+        assert fields == {"locations": ["la-friche", "le-dome"], "sourceId": "123"}
+
+    def test_matches_full_yaml_load(self, tmp_path):
+        text = "description: |\n  line one\n\n  line two\nimage: null\n"
+        path = self._write(tmp_path, f"---\n{text}---\n")
+
+        fields = read_front_matter_fields(path, ("description", "image"))
+
+        assert fields == yaml.safe_load(text)
+
+    @pytest.mark.parametrize(
+        "text", ["name: Concert\n", "---\nname: Concert\n", "---\n---\n"]
+    )
+    def test_missing_front_matter(self, tmp_path, text):
+        path = self._write(tmp_path, text)
+
+        assert read_front_matter_fields(path, ("name",)) == {}
@@ -39,6 +39,10 @@ class TestHTMLParser:
         """Create parser with sample HTML."""
         return HTMLParser(sample_html, base_url="https://example.com")
 
+    def test_uses_lxml_backend(self, parser):
+        """Parsing goes through libxml2, not the pure-Python html.parser."""
+        assert type(parser.soup.builder).__name__ == "LXMLTreeBuilder"
+
     def test_select(self, parser):
         """Test CSS selector."""
         events = parser.select(".event-card")
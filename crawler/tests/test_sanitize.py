@@ -164,3 +164,9 @@ class TestEdgeCases:
         result = sanitize_description(text)
         assert "&rsquo;" not in result
         assert "c\u2019est" in result
+
+    def test_repeated_text_is_cached(self):
+        sanitize_description.cache_clear()
+        assert sanitize_description("Rock &amp; Roll") == "Rock & Roll"
+        assert sanitize_description("Rock &amp; Roll") == "Rock & Roll"
+        assert sanitize_description.cache_info().hits == 1